@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Shared source loading and scanning helpers for the validation scripts."""
+
+import ast
+import hashlib
+import mmap
+import os
+import pickle
+import re
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# (path, mtime_ns, size) -> (text, tree); a changed file gets a new key
+_parsed_cache: dict[tuple[str, int, int], tuple[str, ast.Module]] = {}
+
+# Parsed sources persist here between runs, under the same key
+CACHE_DIR = Path(".cache/validation")
+
+
+@lru_cache(maxsize=32)
+def _read_text(path_str, mtime_ns, size):
+    """Read a file's text; the stat fields only serve as the cache key."""
+    return Path(path_str).read_text(encoding="utf-8")
+
+
+def read_source(path):
+    """Return a file's text, reusing the previous read while the file is unchanged."""
+    st = os.stat(path)
+    return _read_text(str(path), st.st_mtime_ns, st.st_size)
+
+
+def scan_dir(directory):
+    """Map file names in a directory to their DirEntry, or return {} if it is missing."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name: entry for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return {}
+
+
+def load_source(path, entry=None):
+    """Read and parse a source file once, returning (text, tree)."""
+    path = Path(path)
+    # A DirEntry from scan_dir() already carries (or caches) the stat result
+    st = entry.stat() if entry is not None else path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cached = _parsed_cache.get(key)
+    if cached is None:
+        cached = _parsed_cache[key] = _load_parsed(path, key)
+    return cached
+
+
+def _load_parsed(path, key):
+    """Return (text, tree) from the on-disk cache, parsing and storing it on a miss."""
+    digest = hashlib.blake2b(f"{key[0]}:{key[1]}:{key[2]}".encode(), digest_size=16).hexdigest()
+    cache_path = CACHE_DIR / f"{digest}.pkl"
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError, TypeError, ValueError):
+        # Missing, corrupt or stale-format entries are simply rebuilt
+        pass
+    
+    text = path.read_text(encoding="utf-8")
+    parsed = (text, ast.parse(text, filename=str(path)))
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is an optimization only; a read-only tree still validates
+        pass
+    return parsed
+
+
+@lru_cache(maxsize=32)
+def _literal_scanner(literals):
+    """Compile one pattern finding every literal, plus each literal's implied prefixes."""
+    # Longest first, so a literal that is a prefix of another one loses the
+    # alternation only at positions where the longer literal also matches
+    ordered = sorted(literals, key=len, reverse=True)
+    pattern = re.compile(
+        "(?=" + "|".join(f"(?P<g{i}>{re.escape(s)})" for i, s in enumerate(ordered)) + ")"
+    )
+    implied = {
+        f"g{i}": [s for s in ordered if longer.startswith(s)]
+        for i, longer in enumerate(ordered)
+    }
+    return pattern, implied
+
+
+def scan_literals(content, literals):
+    """Report which literals occur in content using a single regex pass."""
+    # The empty string occurs in any content, so only non-empty literals are scanned
+    found = {literal: not literal for literal in literals}
+    needles = tuple(literal for literal in found if literal)
+    if not needles:
+        return found
+    pattern, implied = _literal_scanner(needles)
+    remaining = len(needles)
+    for match in pattern.finditer(content):
+        for literal in implied[match.lastgroup]:
+            if not found[literal]:
+                found[literal] = True
+                remaining -= 1
+        if not remaining:
+            break
+    return found
+
+
+class _SymbolCollector(ast.NodeVisitor):
+    """Fill every symbol bucket during a single traversal of a tree."""
+
+    def __init__(self):
+        # Definitions map name -> argument list, e.g. "hass: HomeAssistant"
+        self.async_defs = {}
+        self.defs = {}
+        self.imports = set()
+        self.calls = set()
+
+    def visit_AsyncFunctionDef(self, node):
+        self.async_defs[node.name] = ast.unparse(node.args)
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        self.defs[node.name] = ast.unparse(node.args)
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node):
+        module = "." * node.level + (node.module or "")
+        self.imports.update((module, alias.name) for alias in node.names)
+
+    def visit_Await(self, node):
+        # Kept in source form, e.g. "await async_register_panel(hass)"
+        self.calls.add(ast.unparse(node))
+        self.generic_visit(node)
+
+
+def extract_symbols(tree):
+    """Collect definitions, imports and awaited calls from a tree in one walk."""
+    collector = _SymbolCollector()
+    collector.visit(tree)
+    return {
+        "async_defs": collector.async_defs,
+        "defs": collector.defs,
+        "imports": collector.imports,
+        "calls": collector.calls,
+    }
+
+
+def scan_file(path, needles):
+    """Return the first offset of each byte needle in a file, or -1 when absent."""
+    with open(path, "rb") as f:
+        # mmap rejects empty files; nothing can be found in them anyway
+        if not os.fstat(f.fileno()).st_size:
+            return dict.fromkeys(needles, -1)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return {needle: mm.find(needle) for needle in needles}
+
+
+
+@lru_cache(maxsize=32)
+def _literal_automaton(literals):
+    """Build an Aho-Corasick automaton over the literals."""
+    automaton = ahocorasick.Automaton()
+    for literal in literals:
+        automaton.add_word(literal, literal)
+    automaton.make_automaton()
+    return automaton
+
+
+def count_literals(content, literals):
+    """Count every (possibly overlapping) occurrence of each literal in one pass."""
+    counts = Counter(dict.fromkeys(literals, 0))
+    needles = tuple(literal for literal in counts if literal)
+    if not needles:
+        return counts
+    if ahocorasick is not None:
+        counts.update(value for _, value in _literal_automaton(needles).iter(content))
+    else:
+        # Same single sweep as scan_literals, counting instead of stopping early
+        pattern, implied = _literal_scanner(needles)
+        for match in pattern.finditer(content):
+            counts.update(implied[match.lastgroup])
+    return counts
+
+
+def has_blocking_open(content):
+    """Return True if any 'with open(' in content is not an 'async with'."""
+    pos = 0
+    while (idx := content.find("with open(", pos)) != -1:
+        line_start = content.rfind("\n", 0, idx) + 1
+        if "async " not in content[line_start:idx]:
+            return True
+        pos = idx + 1
+    return False
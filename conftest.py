@@ -0,0 +1,19 @@
+"""Pytest configuration for the root-level test scripts."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the integration importable as ``ufo_r11_smartir`` once per session,
+# instead of every test module editing sys.path on import
+_CUSTOM_COMPONENTS = str(Path(__file__).parent / "custom_components")
+if _CUSTOM_COMPONENTS not in sys.path:
+    sys.path.insert(0, _CUSTOM_COMPONENTS)
+
+
+@pytest.fixture(scope="session")
+def mock_hass():
+    """One mock Home Assistant instance shared by the whole session."""
+    from test_frontend_fix_validation import MockHass
+    return MockHass()
@@ -12,6 +12,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from homeassistant.components.http import HomeAssistantView
 import voluptuous as vol
 
@@ -127,22 +128,9 @@ class UFODataUpdateCoordinator(DataUpdateCoordinator):
         try:
             # Check device availability via MQTT
             # This is a placeholder for actual device status checking
-            _LOGGER.debug("DEBUG: Attempting to get current UTC time")
-            try:
-                # Try modern HA datetime utility
-                from homeassistant.util import dt as dt_util
-                current_time = dt_util.utcnow()
-                _LOGGER.debug("DEBUG: Successfully got time using dt_util.utcnow()")
-            except AttributeError as dt_err:
-                _LOGGER.error("DEBUG: dt_util.utcnow() failed: %s", dt_err)
-                # Fallback to standard datetime
-                from datetime import datetime, timezone
-                current_time = datetime.now(timezone.utc)
-                _LOGGER.debug("DEBUG: Using fallback datetime.now(timezone.utc)")
-            
             return {
                 "available": True,
-                "last_seen": current_time,
+                "last_seen": dt_util.utcnow(),
                 "device_id": self.device_id,
                 "device_name": self.device_name,
                 "topic": self.mqtt_topic,
@@ -215,6 +203,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         coordinator = hass.data[DOMAIN].pop(entry.entry_id)
         
+        # Write IR code changes that are still waiting on the save debounce
+        if coordinator.device_manager:
+            await coordinator.device_manager.async_shutdown()
+        
         # Clean up frontend panel
         try:
             await async_unregister_panel(hass)
@@ -179,32 +179,32 @@ class DeviceManager:
         mqtt_topic: str
     ) -> bool:
         """Send IR command to UFO-R11 device via MQTT."""
+        code_set = await self._ir_manager.async_load_device(device_id)
+        if not code_set:
+            _LOGGER.error("No code set found for device %s", device_id)
+            return False
+        
+        command = code_set.get_command(category, key)
+        if not command:
+            _LOGGER.error("Command %s.%s not found for device %s", category, key, device_id)
+            return False
+        
+        if not command.validated:
+            _LOGGER.error("Command %s.%s has invalid IR code", category, key)
+            return False
+        
+        # Prepare MQTT message
+        mqtt_payload = {
+            MQTT_IR_CODE_FIELD: command.code
+        }
+        
+        # Send via MQTT
+        mqtt_topic_full = f"{mqtt_topic}/{MQTT_COMMAND_SET}"
+        
+        _LOGGER.info("Sending IR command %s.%s to device %s via %s", 
+                    category, key, device_id, mqtt_topic_full)
+        
         try:
-            code_set = await self._ir_manager.async_load_device(device_id)
-            if not code_set:
-                _LOGGER.error("No code set found for device %s", device_id)
-                return False
-            
-            command = code_set.get_command(category, key)
-            if not command:
-                _LOGGER.error("Command %s.%s not found for device %s", category, key, device_id)
-                return False
-            
-            if not command.validated:
-                _LOGGER.error("Command %s.%s has invalid IR code", category, key)
-                return False
-            
-            # Prepare MQTT message
-            mqtt_payload = {
-                MQTT_IR_CODE_FIELD: command.code
-            }
-            
-            # Send via MQTT
-            mqtt_topic_full = f"{mqtt_topic}/{MQTT_COMMAND_SET}"
-            
-            _LOGGER.info("Sending IR command %s.%s to device %s via %s", 
-                        category, key, device_id, mqtt_topic_full)
-            
             await self.hass.services.async_call(
                 "mqtt",
                 "publish",
@@ -214,14 +214,13 @@ class DeviceManager:
                 },
                 blocking=True,
             )
-            
-            _LOGGER.debug("IR command sent successfully")
-            return True
-            
         except Exception as e:
             _LOGGER.error("Failed to send IR command %s.%s for device %s: %s", 
                          category, key, device_id, str(e))
             return False
+        
+        _LOGGER.debug("IR command sent successfully")
+        return True
     
     async def async_learn_ir_command(
         self,
@@ -329,12 +328,13 @@ class DeviceManager:
             ir_command = IRCommand(
                 name=session["command_name"],
                 code=learned_code,
-                raw_data=f"Learned via UFO-R11 on {dt_util.utcnow().isoformat()}",
+                raw_data=f"Learned via UFO-R11 on {session['start_time'].isoformat()}",
             )
             
             # Add to code set
             if code_set.add_command(session["category"], session["key"], ir_command):
-                await self._ir_manager.async_save_device(device_id)
+                # Learning sessions often come in bursts; coalesce them into one write
+                self._ir_manager.async_schedule_save(device_id)
                 
                 _LOGGER.info("Successfully learned IR command %s for device %s", 
                            session["command_name"], device_id)
@@ -438,22 +438,22 @@ class DeviceManager:
         mqtt_topic: str
     ) -> bool:
         """Test IR command by sending it directly."""
+        _LOGGER.info("Testing IR command for device %s", device_id)
+        
+        # Validate IR code format
+        test_command = IRCommand(name="test", code=ir_code)
+        if not test_command.validated:
+            _LOGGER.error("Invalid IR code format: %s", ir_code)
+            return False
+        
+        # Send test command
+        mqtt_payload = {
+            MQTT_IR_CODE_FIELD: ir_code
+        }
+        
+        mqtt_topic_full = f"{mqtt_topic}/{MQTT_COMMAND_SET}"
+        
         try:
-            _LOGGER.info("Testing IR command for device %s", device_id)
-            
-            # Validate IR code format
-            test_command = IRCommand(name="test", code=ir_code)
-            if not test_command.validated:
-                _LOGGER.error("Invalid IR code format: %s", ir_code)
-                return False
-            
-            # Send test command
-            mqtt_payload = {
-                MQTT_IR_CODE_FIELD: ir_code
-            }
-            
-            mqtt_topic_full = f"{mqtt_topic}/{MQTT_COMMAND_SET}"
-            
             await self.hass.services.async_call(
                 "mqtt",
                 "publish",
@@ -463,13 +463,12 @@ class DeviceManager:
                 },
                 blocking=True,
             )
-            
-            _LOGGER.info("Test command sent successfully for device %s", device_id)
-            return True
-            
         except Exception as e:
             _LOGGER.error("Failed to test command for device %s: %s", device_id, str(e))
             return False
+        
+        _LOGGER.info("Test command sent successfully for device %s", device_id)
+        return True
     
     async def async_remove_device(self, device_id: str) -> bool:
         """Remove device and all its IR codes."""
@@ -482,6 +481,10 @@ class DeviceManager:
             _LOGGER.error("Failed to remove device %s: %s", device_id, str(e))
             return False
     
+    async def async_shutdown(self) -> None:
+        """Write any pending IR code changes."""
+        await self._ir_manager.async_flush()
+    
     def get_learning_status(self, device_id: str) -> Optional[Dict[str, Any]]:
         """Get current learning session status for device."""
         return self._learning_sessions.get(device_id)
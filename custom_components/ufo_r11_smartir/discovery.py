@@ -2,16 +2,25 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import hashlib
 import logging
-from urllib.parse import urlparse
-from typing import Any, Dict, List, Optional, Callable, Coroutine
+from collections import OrderedDict
+import re
+import time
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Callable, Coroutine
 from datetime import datetime, timedelta
+from functools import lru_cache
 
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    SOURCE_DISCOVERY,
+    ConfigEntry,
+    ConfigEntryChange,
+)
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import discovery
-from homeassistant.helpers.discovery import async_load_platform
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 from homeassistant.components import mqtt
 from homeassistant.components import zeroconf
@@ -30,13 +39,55 @@ from .const import (
     MANUFACTURER,
     MODEL,
 )
+from .json_util import JSONDecodeError, json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
 # Discovery constants
 DISCOVERY_TOPIC = f"{MQTT_TOPIC_PREFIX}/bridge/devices"
+DEVICE_LIST_REQUEST_TOPIC = f"{MQTT_TOPIC_PREFIX}/bridge/request/devices"
+# System topic prefixes that never belong to a device
+_BRIDGE_PREFIX = f"{MQTT_TOPIC_PREFIX}/bridge/"
+_CONFIG_PREFIX = f"{MQTT_TOPIC_PREFIX}/config/"
+_SYSTEM_PREFIXES = (_BRIDGE_PREFIX, _CONFIG_PREFIX)
+
+SIGNAL_DEVICE_DISCOVERED = f"{DOMAIN}_discovery"
 DEVICE_AVAILABILITY_TOPIC = f"{MQTT_TOPIC_PREFIX}/+/availability"
-DEVICE_STATUS_TOPIC = f"{MQTT_TOPIC_PREFIX}/+"
+
+# mDNS service types that UFO-R11 devices may advertise
+ZEROCONF_SERVICE_TYPES = ["_http._tcp.local.", "_ufo-r11._tcp.local."]
+
+# Delay used to collapse bursts of zeroconf updates for the same service
+_ZEROCONF_DEBOUNCE = 1.0
+
+# Delay used to coalesce bursts of availability and state messages
+_FLUSH_DELAY = 0.25
+
+# Maximum number of MQTT work items waiting for the discovery worker
+_MAX_QUEUED_WORK = 1024
+
+# Kinds of work queued by the MQTT callbacks
+_WORK_TOPIC = "topic"
+_WORK_DEVICES = "devices"
+
+# Maximum number of discovered devices remembered; the least recently seen are evicted
+_MAX_DISCOVERED = 512
+
+# Maximum number of SSDP announcements remembered, including those of other devices
+_MAX_SEEN_SSDP = 1024
+
+# Persistent cache of discovered devices, written at most every 30 seconds
+DISCOVERY_CACHE_VERSION = 1
+DISCOVERY_CACHE_KEY = f"{DOMAIN}_discovery_cache"
+_DISCOVERY_CACHE_SAVE_DELAY = 30
+
+# Devices not seen for this many seconds are reported as offline
+_OFFLINE_THRESHOLD = timedelta(minutes=10).total_seconds()
+
+# Preformed payloads for the bridge device list and device state requests
+_EMPTY_PAYLOAD = b""
+_GET_STATE_PAYLOAD = b'{"state":""}'
+_GET_TOPIC_FMT = MQTT_TOPIC_PREFIX + "/%s/get"
 
 # UFO-R11 device identification patterns
 UFO_R11_PATTERNS = [
@@ -53,6 +104,56 @@ IR_CAPABILITY_ATTRIBUTES = [
     "infrared",
 ]
 
+IR_CAPABILITY_ATTRS = frozenset(IR_CAPABILITY_ATTRIBUTES)
+
+# Friendly names are matched upper-cased, so only patterns that are already
+# upper-case can ever match (the lower-case "0x" prefix never does).
+UFO_R11_PATTERNS_UPPER = tuple(
+    pattern for pattern in UFO_R11_PATTERNS if pattern == pattern.upper()
+)
+_UFO_PATTERN_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in UFO_R11_PATTERNS_UPPER), re.IGNORECASE
+)
+
+# Case-insensitive matchers for model, vendor and name strings
+_UFO_RE = re.compile(r"UFO-R11|MOES", re.IGNORECASE)
+_UFO_MODEL_RE = re.compile(r"UFO-R11", re.IGNORECASE)
+_MOES_RE = re.compile(r"MOES", re.IGNORECASE)
+
+# Length of the "zigbee2mqtt/" prefix preceding the device segment of a topic
+_TOPIC_PREFIX_LEN = len(MQTT_TOPIC_PREFIX) + 1
+
+
+@lru_cache(maxsize=1024)
+def _parse_topic(topic: str) -> str:
+    """Return the device segment of a Zigbee2MQTT topic."""
+    rest = topic[_TOPIC_PREFIX_LEN:]
+    slash = rest.find("/")
+    return rest if slash < 0 else rest[:slash]
+
+
+@lru_cache(maxsize=256)
+def _fast_host_port(url: str) -> Tuple[Optional[str], Optional[int]]:
+    """Extract the host and port from a URL without building a full ParseResult."""
+    scheme_end = url.find("://")
+    rest = url[scheme_end + 3:] if scheme_end >= 0 else url
+    end = len(rest)
+    for separator in "/?#":
+        index = rest.find(separator)
+        if 0 <= index < end:
+            end = index
+    authority = rest[:end].rpartition("@")[2]
+    
+    if authority.startswith("["):
+        # IPv6 literal, e.g. [fe80::1]:8080
+        host, _, port_str = authority[1:].partition("]")
+        port_str = port_str[1:] if port_str.startswith(":") else ""
+    else:
+        host, _, port_str = authority.partition(":")
+    
+    port = int(port_str) if port_str.isdigit() else None
+    return host.lower() or None, port
+
 
 class UFODeviceDiscovery:
     """Handles automatic discovery of UFO-R11 devices via MQTT."""
@@ -60,10 +161,30 @@ class UFODeviceDiscovery:
     def __init__(self, hass: HomeAssistant):
         """Initialize the discovery service."""
         self.hass = hass
-        self._discovered_devices: Dict[str, Dict[str, Any]] = {}
+        self._discovered_devices: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._discovered_devices_view = MappingProxyType(self._discovered_devices)
+        self._store = Store(hass, DISCOVERY_CACHE_VERSION, DISCOVERY_CACHE_KEY)
+        self._cache_loaded = False
         self._discovery_enabled = True
         self._subscribers: List[Callable] = []
-        self._discovery_lock = asyncio.Lock()
+        # Friendly names of UFO-R11 devices whose state topic is subscribed, mapped to device ID
+        self._known_ufo_topics: Dict[str, str] = {}
+        # Unsubscribe callables of those state topics, keyed by friendly name
+        self._status_unsubscribers: Dict[str, Callable[[], None]] = {}
+        # Device IDs of existing config entries, seeded when discovery starts and
+        # kept current by a config entry listener
+        self._configured_ids: Set[str] = set()
+        # Digest of the last bridge devices payload processed, to skip unchanged republishes
+        self._last_bridge_payload_digest: Optional[bytes] = None
+        # Device IDs for which a discovery flow and notification were already created
+        self._notified: Set[str] = set()
+        # Work queued by MQTT callbacks and the single worker consuming it
+        self._work_queue: asyncio.Queue[Tuple[str, Any]] = asyncio.Queue(_MAX_QUEUED_WORK)
+        self._worker: Optional[asyncio.Task] = None
+        # Location and resolved device ID (None if not a UFO-R11) of already
+        # processed SSDP announcements, keyed by USN
+        self._seen_ssdp_usn: OrderedDict[str, Tuple[Optional[str], Optional[str]]] = OrderedDict()
+        self._pending_zc: Dict[Tuple[str, str], asyncio.TimerHandle] = {}
         self._zeroconf_listener: Optional[Callable[[], None]] = None
         self._ssdp_listener: Optional[Callable[[], Coroutine[Any, Any, None]]] = None # Store the unregister callable
 
@@ -71,19 +192,32 @@ class UFODeviceDiscovery:
         """Start MQTT, mDNS, and SSDP based device discovery."""
         _LOGGER.info("Starting UFO-R11 device discovery (MQTT, mDNS, SSDP)")
         mqtt_started = False
+        self._configured_ids = self._get_configured_device_ids()
+        self._subscribers.append(async_dispatcher_connect(
+            self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._async_config_entry_changed
+        ))
+        if self._worker is None:
+            self._worker = self.hass.async_create_background_task(
+                self._async_drain_work_queue(), name=f"{DOMAIN} discovery worker"
+            )
+        await self._async_load_discovery_cache()
         try:
             if "mqtt" in self.hass.config.components:
                 _LOGGER.info("Starting MQTT discovery for UFO-R11")
-                # Subscribe to Zigbee2MQTT bridge messages
-                await mqtt.async_subscribe(
+                # Subscribe to Zigbee2MQTT bridge messages. Device state topics are
+                # subscribed per UFO-R11 once the bridge device list identifies them.
+                self._subscribers.append(await mqtt.async_subscribe(
                     self.hass, DISCOVERY_TOPIC, self._handle_bridge_devices_message, 0
-                )
-                await mqtt.async_subscribe(
+                ))
+                self._subscribers.append(await mqtt.async_subscribe(
                     self.hass, DEVICE_AVAILABILITY_TOPIC, self._handle_device_availability, 0
-                )
-                await mqtt.async_subscribe(
-                    self.hass, DEVICE_STATUS_TOPIC, self._handle_device_status, 0
-                )
+                ))
+                # Resubscribe to the state of UFO-R11 devices restored from the cache
+                await asyncio.gather(*(
+                    self._async_subscribe_device_status(data["name"], device_id)
+                    for device_id, data in list(self._discovered_devices.items())
+                    if "topic" in data
+                ))
                 await self._request_device_list()
                 _LOGGER.info("MQTT discovery for UFO-R11 started")
                 mqtt_started = True
@@ -98,11 +232,9 @@ class UFODeviceDiscovery:
         try:
             _LOGGER.info("Starting mDNS/Zeroconf discovery for UFO-R11")
             zc_instance = await zeroconf.async_get_instance(self.hass)
-            # Replace "_ufo-r11._tcp.local." with the actual service type if known
-            # For now, let's assume a generic service type or listen more broadly if needed.
-            # This might need adjustment based on how UFO-R11 devices announce themselves.
+            # Only listen to the service types a UFO-R11 may advertise
             self._zeroconf_listener = await zc_instance.async_add_listener(
-                self._handle_zeroconf_service_update, None # Listen to all services initially
+                self._handle_zeroconf_service_update, ZEROCONF_SERVICE_TYPES
             )
             _LOGGER.info("mDNS/Zeroconf discovery for UFO-R11 started")
         except Exception as e:
@@ -153,16 +285,121 @@ class UFODeviceDiscovery:
             await self._ssdp_listener()
             self._ssdp_listener = None
 
+        for unsubscribe in self._subscribers:
+            unsubscribe()
+        self._subscribers.clear()
+        for unsubscribe in self._status_unsubscribers.values():
+            unsubscribe()
+        self._status_unsubscribers.clear()
+        self._known_ufo_topics.clear()
+        self._last_bridge_payload_digest = None
+
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        self._work_queue = asyncio.Queue(_MAX_QUEUED_WORK)
+        self._seen_ssdp_usn.clear()
+        for handle in self._pending_zc.values():
+            handle.cancel()
+        self._pending_zc.clear()
+
         _LOGGER.info("UFO-R11 device discovery stopped (MQTT, mDNS, SSDP)")
 
+    async def _async_load_discovery_cache(self) -> None:
+        """Restore devices discovered before the last restart."""
+        if self._cache_loaded:
+            return
+        self._cache_loaded = True
+        
+        try:
+            cached = await self._store.async_load()
+        except Exception as e:
+            _LOGGER.warning("Failed to load discovery cache: %s", str(e))
+            return
+        if not cached:
+            return
+        
+        now = dt_util.utcnow()
+        now_monotonic = time.monotonic()
+        for device_id, data in cached.items():
+            if device_id in self._discovered_devices or self._is_device_already_configured(device_id):
+                continue
+            
+            for key in ("discovered_at", "last_seen"):
+                data[key] = dt_util.parse_datetime(data.get(key) or "") or now
+            # Rebase the staleness clock on the persisted wall-clock time
+            data["last_seen_monotonic"] = now_monotonic - (now - data["last_seen"]).total_seconds()
+            self._discovered_devices[device_id] = data
+        
+        while len(self._discovered_devices) > _MAX_DISCOVERED:
+            self._discovered_devices.popitem(last=False)
+        
+        _LOGGER.debug("Restored %d discovered devices from cache", len(self._discovered_devices))
+
+    @callback
+    def _async_schedule_cache_save(self) -> None:
+        """Schedule a delayed write of the discovered devices cache."""
+        self._store.async_delay_save(self._discovery_cache_data, _DISCOVERY_CACHE_SAVE_DELAY)
+
+    @callback
+    def _discovery_cache_data(self) -> Dict[str, Dict[str, Any]]:
+        """Return the discovered devices in their persisted form."""
+        return {
+            device_id: {
+                key: value for key, value in data.items() if key != "last_seen_monotonic"
+            }
+            for device_id, data in self._discovered_devices.items()
+        }
+
+    @callback
+    def _async_queue_work(self, kind: str, value: Any) -> bool:
+        """Queue work for the discovery worker; return False if it was dropped."""
+        try:
+            self._work_queue.put_nowait((kind, value))
+        except asyncio.QueueFull:
+            _LOGGER.debug("Discovery work queue full, dropping %s work", kind)
+            return False
+        return True
+
+    async def _async_drain_work_queue(self) -> None:
+        """Process queued MQTT work in batches for as long as discovery runs."""
+        while True:
+            item = await self._work_queue.get()
+            # Let bursts accumulate so they are handled in one pass
+            await asyncio.sleep(_FLUSH_DELAY)
+            
+            topics: Set[str] = set()
+            devices: List[Dict[str, Any]] = []
+            while True:
+                kind, value = item
+                if kind == _WORK_TOPIC:
+                    topics.add(value)
+                else:
+                    devices.extend(value)
+                try:
+                    item = self._work_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+            
+            try:
+                await self._process_queued(topics, devices)
+            except Exception as e:
+                _LOGGER.error("Failed to process queued discovery work: %s", str(e))
+
+    async def _process_queued(self, topics: Set[str], devices: List[Dict[str, Any]]) -> None:
+        """Process the topics and devices collected since the last flush."""
+        if topics:
+            await asyncio.gather(*(self._check_device_capabilities(topic) for topic in topics))
+        if devices:
+            await self._process_device_list(devices)
+
     async def _request_device_list(self) -> None:
         """Request current device list from Zigbee2MQTT bridge."""
         try:
-            bridge_request_topic = f"{MQTT_TOPIC_PREFIX}/bridge/request/devices"
             await mqtt.async_publish(
                 self.hass,
-                bridge_request_topic,
-                "",
+                DEVICE_LIST_REQUEST_TOPIC,
+                _EMPTY_PAYLOAD,
                 0,
                 False
             )
@@ -176,21 +413,51 @@ class UFODeviceDiscovery:
         if not self._discovery_enabled:
             return
         
+        raw_payload = message.payload
+        if isinstance(raw_payload, str):
+            raw_payload = raw_payload.encode("utf-8")
+        payload_digest = hashlib.blake2b(raw_payload, digest_size=16).digest()
+        if payload_digest == self._last_bridge_payload_digest:
+            return
+        
         try:
-            payload = json.loads(message.payload)
-            _LOGGER.debug("Received bridge devices message: %s", payload)
-            
-            if isinstance(payload, list):
-                # This is a device list
-                self.hass.async_create_task(self._process_device_list(payload))
-            elif isinstance(payload, dict) and "type" in payload:
-                # This might be a single device announcement
-                if payload.get("type") == "device_announced":
-                    device_info = payload.get("data", {})
-                    self.hass.async_create_task(self._process_single_device(device_info))
-                    
-        except (json.JSONDecodeError, Exception) as e:
-            _LOGGER.debug("Failed to parse bridge devices message: %s", str(e))
+            payload = json_loads(message.payload)
+        except JSONDecodeError:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Ignoring malformed bridge devices message")
+            return
+        
+        _LOGGER.debug("Received bridge devices message: %s", payload)
+        
+        # Only remember the payload once its work is queued, so a dropped one is retried
+        handled = True
+        
+        if isinstance(payload, list):
+            # This is a device list, only schedule work for new UFO-R11 devices
+            # and keep just the fields discovery reads from each of them
+            now = dt_util.utcnow()
+            new_devices = [
+                {
+                    "friendly_name": device.get("friendly_name"),
+                    "ieee_address": device.get("ieee_address"),
+                    "definition": device.get("definition"),
+                }
+                for device in payload
+                if self._is_ufo_r11_from_bridge(device)
+                and self._prefilter_device(device, now)
+            ]
+            del payload
+            if new_devices:
+                handled = self._async_queue_work(_WORK_DEVICES, new_devices)
+        elif isinstance(payload, dict) and payload.get("type") == "device_announced":
+            # This is a single device announcement
+            device_info = payload.get("data")
+            if self._is_ufo_r11_from_bridge(device_info) and \
+               self._prefilter_device(device_info, dt_util.utcnow()):
+                handled = self._async_queue_work(_WORK_DEVICES, [device_info])
+        
+        if handled:
+            self._last_bridge_payload_digest = payload_digest
     
     @callback
     def _handle_device_availability(self, message) -> None:
@@ -198,21 +465,27 @@ class UFODeviceDiscovery:
         if not self._discovery_enabled:
             return
         
-        try:
-            # Extract device topic from message topic
-            topic_parts = message.topic.split("/")
-            if len(topic_parts) >= 2:
-                device_topic = topic_parts[1]
-                availability = message.payload.decode('utf-8')
-                
-                _LOGGER.debug("Device %s availability: %s", device_topic, availability)
-                
-                if availability == "online":
-                    # Device came online, check if it's a UFO-R11
-                    self.hass.async_create_task(self._check_device_capabilities(device_topic))
-                    
-        except Exception as e:
-            _LOGGER.debug("Failed to handle availability message: %s", str(e))
+        topic = message.topic
+        if topic.startswith(_SYSTEM_PREFIXES):
+            return
+        
+        # Extract device topic from message topic
+        device_topic = _parse_topic(topic)
+        
+        # Only UFO-R11 devices identified from the bridge device list have
+        # their state topic subscribed, so probing any other device is wasted
+        if device_topic not in self._known_ufo_topics:
+            return
+        
+        availability = message.payload
+        if isinstance(availability, bytes):
+            availability = availability.decode("utf-8", "replace")
+        
+        _LOGGER.debug("Device %s availability: %s", device_topic, availability)
+        
+        if availability == "online":
+            # UFO-R11 came online, refresh its state
+            self._async_queue_work(_WORK_TOPIC, device_topic)
     
     @callback
     def _handle_device_status(self, message) -> None:
@@ -220,141 +493,159 @@ class UFODeviceDiscovery:
         if not self._discovery_enabled:
             return
         
+        topic = message.topic
+        if topic.startswith(_SYSTEM_PREFIXES):
+            return
+        
+        # Extract device topic from message topic
+        device_topic = _parse_topic(topic)
+        
+        # Only decode payloads of known UFO-R11 topics
+        if device_topic not in self._known_ufo_topics:
+            return
+        
         try:
-            # Extract device topic from message topic
-            topic_parts = message.topic.split("/")
-            if len(topic_parts) >= 2:
-                device_topic = topic_parts[1]
-                
-                # Skip bridge and other system topics
-                if device_topic in ["bridge", "config"]:
-                    return
-                
-                payload = json.loads(message.payload)
-                _LOGGER.debug("Device status update for %s: %s", device_topic, payload)
-                
-                # Check if this device has IR capabilities
-                if self._has_ir_capabilities(payload):
-                    device_info = {
-                        "friendly_name": device_topic,
-                        "ieee_address": device_topic,
-                        "definition": {
-                            "model": "UFO-R11",
-                            "vendor": "MOES"
-                        },
-                        "status": payload
-                    }
-                    self.hass.async_create_task(self._process_single_device(device_info))
-                    
-        except (json.JSONDecodeError, Exception) as e:
-            _LOGGER.debug("Failed to handle device status message: %s", str(e))
+            payload = json_loads(message.payload)
+        except JSONDecodeError:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Ignoring malformed state message from %s", device_topic)
+            return
+        
+        _LOGGER.debug("Device status update for %s: %s", device_topic, payload)
+        
+        # Check if this device reports IR capabilities
+        if self._is_ufo_r11_from_status(device_topic, payload):
+            device_info = {
+                "friendly_name": device_topic,
+                "ieee_address": self._known_ufo_topics[device_topic],
+                "definition": {
+                    "model": "UFO-R11",
+                    "vendor": "MOES"
+                },
+                "status": payload
+            }
+            if self._prefilter_device(device_info, dt_util.utcnow()):
+                self._async_queue_work(_WORK_DEVICES, [device_info])
     
-    def _has_ir_capabilities(self, payload: Dict[str, Any]) -> bool:
-        """Check if device payload indicates IR capabilities."""
-        if not isinstance(payload, dict):
+    def _is_ufo_r11_from_bridge(self, device_info: Dict[str, Any]) -> bool:
+        """Check if a Zigbee2MQTT bridge device entry is a UFO-R11."""
+        if not isinstance(device_info, dict):
             return False
         
-        # Check for IR-related attributes
-        for attr in IR_CAPABILITY_ATTRIBUTES:
-            if attr in payload:
-                return True
-        
-        # Check for device model in payload
-        if "device" in payload:
-            device_info = payload["device"]
-            if isinstance(device_info, dict):
-                model = device_info.get("model", "")
-                if any(pattern in str(model).upper() for pattern in ["UFO-R11", "MOES"]):
-                    return True
+        # Zigbee2MQTT has already resolved the model and vendor of interviewed devices
+        definition = device_info.get("definition")
+        if isinstance(definition, dict):
+            return "UFO-R11" in str(definition.get("model")) or "MOES" in str(definition.get("vendor"))
         
-        return False
+        # Devices still being interviewed (and device announcements) only carry a name
+        friendly_name = device_info.get("friendly_name")
+        return bool(friendly_name and _UFO_PATTERN_RE.search(str(friendly_name)))
     
+    def _is_ufo_r11_from_status(self, device_topic: str, payload: Any) -> bool:
+        """Check if a state payload of a known UFO-R11 topic reports IR capabilities."""
+        return (
+            device_topic in self._known_ufo_topics
+            and isinstance(payload, dict)
+            and not IR_CAPABILITY_ATTRS.isdisjoint(payload)
+        )
+    
+    @callback
+    def _prefilter_device(self, device_info: Dict[str, Any], now: datetime) -> Optional[str]:
+        """Return the device ID if an identified UFO-R11 still needs processing.
+
+        Already discovered devices only get their last_seen refreshed here, so the
+        MQTT callbacks never schedule a task for them.
+        """
+        device_id = self._extract_device_id(device_info)
+        if not device_id:
+            return None
+
+        if self._touch_discovered_device(device_id, device_info, now):
+            return None
+
+        return device_id
+
     async def _process_device_list(self, devices: List[Dict[str, Any]]) -> None:
         """Process a list of devices from Zigbee2MQTT."""
-        async with self._discovery_lock:
-            _LOGGER.debug("Processing device list with %d devices", len(devices))
-            
-            for device in devices:
-                if self._is_ufo_r11_device(device):
-                    await self._process_single_device(device)
-    
-    async def _process_single_device(self, device_info: Dict[str, Any]) -> None:
-        """Process a single device for UFO-R11 discovery."""
-        async with self._discovery_lock:
-            if not self._is_ufo_r11_device(device_info):
-                return
-            
-            device_id = self._extract_device_id(device_info)
-            friendly_name = device_info.get("friendly_name", device_id)
-            
-            if not device_id:
-                _LOGGER.debug("No valid device ID found in device info")
-                return
-            
-            # Check if device is already discovered or configured
-            if await self._is_device_already_configured(device_id):
-                _LOGGER.debug("Device %s already configured, skipping", device_id)
-                return
-            
-            if device_id in self._discovered_devices:
-                _LOGGER.debug("Device %s already discovered, updating info", device_id)
-                self._discovered_devices[device_id].update({
-                    "last_seen": dt_util.utcnow(),
-                    "device_info": device_info
-                })
-                return
-            
-            # New UFO-R11 device discovered
-            discovery_data = {
-                "device_id": device_id,
-                "name": friendly_name,
-                "topic": f"{MQTT_TOPIC_PREFIX}/{friendly_name}",
-                "device_type": DEVICE_TYPE_AC,
-                "code_source": CODE_SOURCE_POINTCODES,
-                "discovered_at": dt_util.utcnow(),
-                "last_seen": dt_util.utcnow(),
-                "device_info": device_info,
-                "manufacturer": MANUFACTURER,
-                "model": MODEL,
-            }
-            
-            self._discovered_devices[device_id] = discovery_data
-            
-            _LOGGER.info("Discovered new UFO-R11 device: %s (%s)", friendly_name, device_id)
-            
-            # Notify discovery
-            await self._notify_device_discovered(discovery_data)
+        _LOGGER.debug("Processing device list with %d devices", len(devices))
+        
+        now = dt_util.utcnow()
+        new_devices = []
+        # Devices are only queued once identified as UFO-R11 by the MQTT callbacks
+        for device in devices:
+            discovery_data = self._register_device(device, now)
+            if discovery_data:
+                new_devices.append(discovery_data)
+        
+        if not new_devices:
+            return
+        
+        await asyncio.gather(*(
+            self._async_subscribe_device_status(data["name"], data["device_id"])
+            for data in new_devices
+        ))
+        self._notify_devices_discovered(new_devices)
     
-    def _is_ufo_r11_device(self, device_info: Dict[str, Any]) -> bool:
-        """Check if device is a UFO-R11 based on available information."""
-        if not isinstance(device_info, dict):
-            return False
+    def _register_device(
+        self, device_info: Dict[str, Any], now: datetime
+    ) -> Optional[Dict[str, Any]]:
+        """Record a UFO-R11 device and return its discovery data if it is new."""
+        device_id = self._extract_device_id(device_info)
+        friendly_name = device_info.get("friendly_name", device_id)
         
-        # Check device definition
-        definition = device_info.get("definition", {})
-        if isinstance(definition, dict):
-            model = definition.get("model", "")
-            vendor = definition.get("vendor", "")
-            
-            if "UFO-R11" in str(model) or "MOES" in str(vendor):
-                return True
+        if not device_id:
+            _LOGGER.debug("No valid device ID found in device info")
+            return None
         
-        # Check friendly name patterns
-        friendly_name = device_info.get("friendly_name", "")
-        if any(pattern in str(friendly_name).upper() for pattern in UFO_R11_PATTERNS):
-            return True
+        # Check if device is already discovered or configured
+        if self._is_device_already_configured(device_id):
+            _LOGGER.debug("Device %s already configured, skipping", device_id)
+            return None
         
-        # Check for IR capabilities in device status
-        if "status" in device_info:
-            return self._has_ir_capabilities(device_info["status"])
+        if self._touch_discovered_device(device_id, device_info, now):
+            _LOGGER.debug("Device %s already discovered, updated info", device_id)
+            return None
         
-        # Check IEEE address pattern (Zigbee devices)
-        ieee_address = device_info.get("ieee_address", "")
-        if ieee_address and ieee_address.startswith("0x") and len(ieee_address) == 18:
-            # Additional checks could be added here for known UFO-R11 OUI patterns
-            return self._has_ir_capabilities(device_info)
+        # New UFO-R11 device discovered
+        discovery_data = {
+            "device_id": device_id,
+            "name": friendly_name,
+            "topic": f"{MQTT_TOPIC_PREFIX}/{friendly_name}",
+            "device_type": DEVICE_TYPE_AC,
+            "code_source": CODE_SOURCE_POINTCODES,
+            "discovered_at": now,
+            "last_seen": now,
+            "last_seen_monotonic": time.monotonic(),
+            "device_info": device_info,
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
+        }
         
-        return False
+        self._store_discovered_device(device_id, discovery_data)
+        
+        _LOGGER.info("Discovered new UFO-R11 device: %s (%s)", friendly_name, device_id)
+        return discovery_data
+    
+    async def _async_subscribe_device_status(self, friendly_name: str, device_id: str) -> None:
+        """Subscribe to the state topic of a single UFO-R11 device."""
+        if friendly_name in self._known_ufo_topics:
+            return
+        
+        self._known_ufo_topics[friendly_name] = device_id
+        try:
+            unsubscribe = await mqtt.async_subscribe(
+                self.hass, f"{MQTT_TOPIC_PREFIX}/{friendly_name}", self._handle_device_status, 0
+            )
+        except Exception as e:
+            self._known_ufo_topics.pop(friendly_name, None)
+            _LOGGER.warning("Failed to subscribe to state of device %s: %s", friendly_name, str(e))
+            return
+        
+        # The device may have been forgotten while subscribing
+        if self._known_ufo_topics.get(friendly_name) != device_id:
+            unsubscribe()
+            return
+        self._status_unsubscribers[friendly_name] = unsubscribe
     
     def _extract_device_id(self, device_info: Dict[str, Any]) -> Optional[str]:
         """Extract device ID from device info."""
@@ -370,24 +661,88 @@ class UFODeviceDiscovery:
         
         return None
     
-    async def _is_device_already_configured(self, device_id: str) -> bool:
-        """Check if device is already configured in Home Assistant."""
-        # Check existing config entries
-        for entry in self.hass.config_entries.async_entries(DOMAIN):
-            if entry.data.get(CONF_DEVICE_ID) == device_id:
-                return True
+    @callback
+    def _touch_discovered_device(
+        self, device_id: str, device_info: Dict[str, Any], now: datetime
+    ) -> bool:
+        """Refresh an already discovered device; return False if it is unknown."""
+        discovery_data = self._refresh_last_seen(device_id, now)
+        if discovery_data is None:
+            return False
         
-        return False
+        discovery_data["device_info"] = device_info
+        return True
+    
+    @callback
+    def _refresh_last_seen(self, device_id: str, now: datetime) -> Optional[Dict[str, Any]]:
+        """Mark an already discovered device as seen and return its discovery data."""
+        discovery_data = self._discovered_devices.get(device_id)
+        if discovery_data is None:
+            return None
+        
+        self._discovered_devices.move_to_end(device_id)
+        discovery_data["last_seen"] = now
+        discovery_data["last_seen_monotonic"] = time.monotonic()
+        return discovery_data
+    
+    @callback
+    def _store_discovered_device(self, device_id: str, discovery_data: Dict[str, Any]) -> None:
+        """Store a discovered device, evicting the least recently seen beyond the limit."""
+        self._discovered_devices[device_id] = discovery_data
+        self._discovered_devices.move_to_end(device_id)
+        if len(self._discovered_devices) > _MAX_DISCOVERED:
+            evicted_id, evicted_data = self._discovered_devices.popitem(last=False)
+            self._forget_device(evicted_id, evicted_data)
+            _LOGGER.debug("Discovered device limit reached, forgetting %s", evicted_id)
+        self._async_schedule_cache_save()
+    
+    @callback
+    def _forget_device(self, device_id: str, discovery_data: Dict[str, Any]) -> None:
+        """Drop the per-device state kept for a device no longer remembered."""
+        self._notified.discard(device_id)
+        
+        ssdp_info = discovery_data.get("ssdp_info")
+        if ssdp_info:
+            self._seen_ssdp_usn.pop(ssdp_info.get("usn"), None)
+        
+        for friendly_name in [
+            name for name, known_id in self._known_ufo_topics.items() if known_id == device_id
+        ]:
+            del self._known_ufo_topics[friendly_name]
+            unsubscribe = self._status_unsubscribers.pop(friendly_name, None)
+            if unsubscribe is not None:
+                unsubscribe()
+    
+    def _get_configured_device_ids(self) -> Set[str]:
+        """Get the device IDs of all existing config entries."""
+        return {
+            entry.data.get(CONF_DEVICE_ID)
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+        }
+    
+    @callback
+    def _async_config_entry_changed(
+        self, change: ConfigEntryChange, entry: ConfigEntry
+    ) -> None:
+        """Refresh the configured device IDs when one of our config entries changes."""
+        if entry.domain == DOMAIN:
+            self._configured_ids = self._get_configured_device_ids()
+            # Let the next bridge device list be evaluated against the new entries
+            self._last_bridge_payload_digest = None
+    
+    @callback
+    def _is_device_already_configured(self, device_id: str) -> bool:
+        """Check if device is already configured in Home Assistant."""
+        return device_id in self._configured_ids
     
     async def _check_device_capabilities(self, device_topic: str) -> None:
         """Request device capabilities to verify it's a UFO-R11."""
         try:
             # Send a get command to retrieve device attributes
-            get_topic = f"{MQTT_TOPIC_PREFIX}/{device_topic}/get"
             await mqtt.async_publish(
                 self.hass,
-                get_topic,
-                json.dumps({"state": ""}),
+                _GET_TOPIC_FMT % device_topic,
+                _GET_STATE_PAYLOAD,
                 0,
                 False
             )
@@ -395,61 +750,73 @@ class UFODeviceDiscovery:
         except Exception as e:
             _LOGGER.debug("Failed to request capabilities for %s: %s", device_topic, str(e))
     
-    async def _notify_device_discovered(self, discovery_data: Dict[str, Any]) -> None:
-        """Notify about discovered device."""
+    @callback
+    def _notify_devices_discovered(self, new_devices: List[Dict[str, Any]]) -> None:
+        """Notify about a batch of discovered devices."""
+        new_devices = [data for data in new_devices if data["device_id"] not in self._notified]
+        if not new_devices:
+            return
+        
         try:
-            # Send discovery notification to config flow
-            await discovery.async_load_platform(
-                self.hass,
-                "config_flow",
-                DOMAIN,
-                discovery_data,
-                {}
-            )
+            for discovery_data in new_devices:
+                self._notified.add(discovery_data["device_id"])
+                async_dispatcher_send(self.hass, SIGNAL_DEVICE_DISCOVERED, discovery_data)
+                # Start a discovery config flow; HA aborts duplicates by unique ID
+                self.hass.async_create_task(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN, context={"source": SOURCE_DISCOVERY}, data=discovery_data
+                    ),
+                    name=f"{DOMAIN} discovery flow {discovery_data['device_id']}",
+                )
             
-            # Create persistent notification for user
+            # Create one persistent notification for the whole batch
+            device_lines = "\n".join(
+                f"- {data['name']} (Device ID: {data['device_id']})" for data in new_devices
+            )
             self.hass.components.persistent_notification.async_create(
-                f"New UFO-R11 device discovered: {discovery_data['name']}\n"
-                f"Device ID: {discovery_data['device_id']}\n"
-                f"Click to configure it automatically.",
+                f"New UFO-R11 devices discovered:\n{device_lines}\n"
+                f"Click to configure them automatically.",
                 title="UFO-R11 Device Discovery",
-                notification_id=f"ufo_r11_discovery_{discovery_data['device_id']}",
+                notification_id=f"ufo_r11_discovery_{new_devices[0]['device_id']}",
             )
             
-            _LOGGER.info("Notified discovery of device %s", discovery_data['device_id'])
+            _LOGGER.info(
+                "Notified discovery of devices %s",
+                ", ".join(data["device_id"] for data in new_devices),
+            )
             
         except Exception as e:
             _LOGGER.error("Failed to notify device discovery: %s", str(e))
     
-    def get_discovered_devices(self) -> Dict[str, Dict[str, Any]]:
-        """Get all discovered devices."""
-        return self._discovered_devices.copy()
+    def get_discovered_devices(self) -> Mapping[str, Dict[str, Any]]:
+        """Get a read-only live view of all discovered devices; callers must not mutate it."""
+        return self._discovered_devices_view
     
     def clear_discovered_device(self, device_id: str) -> bool:
         """Clear a discovered device (after it's been configured)."""
         if device_id in self._discovered_devices:
-            del self._discovered_devices[device_id]
+            self._forget_device(device_id, self._discovered_devices.pop(device_id))
+            self._async_schedule_cache_save()
             _LOGGER.debug("Cleared discovered device %s", device_id)
             return True
         return False
     
-    async def async_get_device_status(self, device_id: str) -> Optional[Dict[str, Any]]:
-        """Get current status of a discovered device."""
-        if device_id not in self._discovered_devices:
+    @callback
+    def get_device_status(self, device_id: str) -> Optional[Mapping[str, Any]]:
+        """Get a read-only view of the current status of a discovered device."""
+        device_data = self._discovered_devices.get(device_id)
+        if device_data is None:
             return None
         
-        device_data = self._discovered_devices[device_id]
-        
         # Check if device is still available
-        last_seen = device_data.get("last_seen")
+        last_seen = device_data.get("last_seen_monotonic")
         if last_seen:
-            time_diff = dt_util.utcnow() - last_seen
-            if time_diff > timedelta(minutes=10):
+            if time.monotonic() - last_seen > _OFFLINE_THRESHOLD:
                 device_data["status"] = "offline"
             else:
                 device_data["status"] = "online"
         
-        return device_data
+        return MappingProxyType(device_data)
 
     @callback
     def _handle_zeroconf_service_update(
@@ -473,44 +840,65 @@ class UFODeviceDiscovery:
         # if info:
         #    self.hass.async_create_task(self._process_zeroconf_device(info))
         # For now, just log
+        key = (service_type, name)
+        pending = self._pending_zc.pop(key, None)
+        if pending is not None:
+            pending.cancel()
+        
+        if state_change == zeroconf.ServiceStateChange.Removed:
+            return
+        
         if state_change in (zeroconf.ServiceStateChange.Added, zeroconf.ServiceStateChange.Updated):
-            self.hass.async_create_task(self._async_process_zeroconf_service(service_type, name))
+            # Debounce bursts of updates into one service info lookup
+            self._pending_zc[key] = self.hass.loop.call_later(
+                _ZEROCONF_DEBOUNCE, self._async_fire_zeroconf_service, key
+            )
 
-    def _is_ufo_r11_zeroconf(self, info: zeroconf.ZeroconfServiceInfo) -> bool:
+    @callback
+    def _async_fire_zeroconf_service(self, key: Tuple[str, str]) -> None:
+        """Process a zeroconf service once its updates have settled."""
+        self._pending_zc.pop(key, None)
+        self.hass.async_create_task(
+            self._async_process_zeroconf_service(*key),
+            name=f"{DOMAIN} zeroconf service {key[1]}",
+        )
+
+    def _is_ufo_r11_zeroconf(
+        self, info: zeroconf.ZeroconfServiceInfo, properties: Dict[str, Any]
+    ) -> bool:
         """Check if a Zeroconf service is a UFO-R11 device."""
         if not info:
             return False
         
         # Check service type (e.g., _ufo-r11._tcp.local. or _http._tcp.local.)
         # This is a guess; actual service type might differ.
-        if "_ufo-r11._tcp.local." in info.type or \
-           (info.type == "_http._tcp.local." and "ufo-r11" in info.name.lower()):
+        if "_ufo-r11._tcp.local." in info.type:
             return True
 
-        # Check properties for keywords
-        properties = {k.lower(): v for k, v in info.decoded_properties.items()}
-        if "ufo-r11" in properties.get("model", "").lower() or \
-           "moes" in properties.get("manufacturer", "").lower():
+        # Check properties (keys already lower-cased) for keywords
+        if _UFO_MODEL_RE.search(properties.get("model") or "") or \
+           _MOES_RE.search(properties.get("manufacturer") or ""):
             return True
         
-        # Check name
-        if "ufo-r11" in info.name.lower() or "moes" in info.name.lower():
+        # Check name (this also covers UFO-R11 devices advertised as _http._tcp.local.)
+        if _UFO_RE.search(info.name):
             return True
             
         return False
 
-    def _extract_zeroconf_device_id(self, info: zeroconf.ZeroconfServiceInfo) -> Optional[str]:
+    def _extract_zeroconf_device_id(
+        self, info: zeroconf.ZeroconfServiceInfo, properties: Dict[str, Any]
+    ) -> Optional[str]:
         """Extract a unique device ID from Zeroconf info (e.g., MAC address or serial)."""
-        # Prefer MAC address from properties if available
-        properties = {k.lower(): v for k, v in info.decoded_properties.items()}
+        # Prefer MAC address from properties (keys already lower-cased) if available
         mac = properties.get("mac") or properties.get("deviceid")
         if mac:
             return str(mac).replace(":", "").lower()
         
         # Fallback to a part of the service name if it seems unique
         # This is less reliable
-        name_part = info.name.split('.')[0]
-        if "ufo-r11" in name_part.lower() and len(name_part) > 8: # Heuristic
+        name_part = info.name.partition('.')[0]
+        if len(name_part) > 8 and _UFO_MODEL_RE.search(name_part): # Heuristic
             return name_part
             
         # Fallback to host if nothing else (least reliable as ID)
@@ -524,11 +912,16 @@ class UFODeviceDiscovery:
         zc = await zeroconf.async_get_instance(self.hass)
         info = await zc.async_get_service_info(service_type, name)
         _LOGGER.debug("Processing Zeroconf service: %s, info: %s", name, info)
-        if not info:
+        # Discovery may have been stopped while the lookup was in flight
+        if not info or not self._discovery_enabled:
             return
 
-        if self._is_ufo_r11_zeroconf(info):
-            device_id = self._extract_zeroconf_device_id(info)
+        # Decode the TXT properties once for all checks below
+        properties = info.decoded_properties
+
+        properties_lc = {k.lower(): v for k, v in properties.items()}
+        if self._is_ufo_r11_zeroconf(info, properties_lc):
+            device_id = self._extract_zeroconf_device_id(info, properties_lc)
             if not device_id:
                 _LOGGER.debug("Could not extract device ID from Zeroconf info: %s", info)
                 return
@@ -543,12 +936,12 @@ class UFODeviceDiscovery:
                 "name": cleaned_name or f"UFO-R11 {device_id[:8]}",
                 "host": info.host,
                 "port": info.port,
-                "properties": info.decoded_properties,
+                "properties": properties,
                 "discovery_source": "zeroconf",
-                "manufacturer": info.decoded_properties.get("manufacturer", MANUFACTURER),
-                "model": info.decoded_properties.get("model", MODEL),
+                "manufacturer": properties.get("manufacturer", MANUFACTURER),
+                "model": properties.get("model", MODEL),
             }
-            await self._process_discovered_network_device(discovery_data)
+            self._process_discovered_network_device(discovery_data)
 
     def _is_ufo_r11_ssdp(self, info: ssdp.SsdpServiceInfo) -> bool:
         """Check if an SSDP service is a UFO-R11 device."""
@@ -556,11 +949,10 @@ class UFODeviceDiscovery:
             return False
 
         # Check manufacturer and model from UPnP data
-        manufacturer = info.upnp.get(ssdp.ATTR_UPNP_MANUFACTURER, "").lower()
-        model_name = info.upnp.get(ssdp.ATTR_UPNP_MODEL_NAME, "").lower()
-        friendly_name = info.upnp.get(ssdp.ATTR_UPNP_FRIENDLY_NAME, "").lower()
-
-        if "moes" in manufacturer or "ufo-r11" in model_name or "ufo-r11" in friendly_name:
+        upnp = info.upnp
+        if _MOES_RE.search(upnp.get(ssdp.ATTR_UPNP_MANUFACTURER, "")) or \
+           _UFO_MODEL_RE.search(upnp.get(ssdp.ATTR_UPNP_MODEL_NAME, "")) or \
+           _UFO_MODEL_RE.search(upnp.get(ssdp.ATTR_UPNP_FRIENDLY_NAME, "")):
             return True
         
         # Check service type (ST) if a specific one is known for UFO-R11
@@ -602,11 +994,26 @@ class UFODeviceDiscovery:
         if change == ssdp.SsdpChange.BYEBYE: # Device leaving
             # TODO: Handle device removal if necessary (e.g., mark as unavailable)
             _LOGGER.debug("SSDP device %s left", info.ssdp_usn)
+            self._seen_ssdp_usn.pop(info.ssdp_usn, None)
             return
         
         if change == ssdp.SsdpChange.ALIVE or change == ssdp.SsdpChange.UPDATE:
-            if self._is_ufo_r11_ssdp(info):
-                device_id = self._extract_ssdp_device_id(info)
+            # Re-announcements that carry nothing new only keep the device online
+            seen = self._seen_ssdp_usn.get(info.ssdp_usn)
+            if seen is not None and seen[0] == info.ssdp_location:
+                self._seen_ssdp_usn.move_to_end(info.ssdp_usn)
+                if seen[1] is not None:
+                    self._refresh_last_seen(seen[1], dt_util.utcnow())
+                return
+
+            is_ufo_r11 = self._is_ufo_r11_ssdp(info)
+            device_id = self._extract_ssdp_device_id(info) if is_ufo_r11 else None
+            self._seen_ssdp_usn[info.ssdp_usn] = (info.ssdp_location, device_id)
+            self._seen_ssdp_usn.move_to_end(info.ssdp_usn)
+            if len(self._seen_ssdp_usn) > _MAX_SEEN_SSDP:
+                self._seen_ssdp_usn.popitem(last=False)
+
+            if is_ufo_r11:
                 if not device_id:
                     _LOGGER.debug("Could not extract device ID from SSDP info: %s", info)
                     return
@@ -615,10 +1022,7 @@ class UFODeviceDiscovery:
                 host = None
                 port = None
                 if info.ssdp_location:
-                    # from urllib.parse import urlparse # Moved to top
-                    parsed_url = urlparse(info.ssdp_location)
-                    host = parsed_url.hostname
-                    port = parsed_url.port
+                    host, port = _fast_host_port(info.ssdp_location)
 
                 discovery_data = {
                     "device_id": device_id,
@@ -638,49 +1042,49 @@ class UFODeviceDiscovery:
                     "manufacturer": info.upnp.get(ssdp.ATTR_UPNP_MANUFACTURER, MANUFACTURER),
                     "model": info.upnp.get(ssdp.ATTR_UPNP_MODEL_NAME, MODEL),
                 }
-                await self._process_discovered_network_device(discovery_data)
+                self._process_discovered_network_device(discovery_data)
 
-    async def _process_discovered_network_device(self, discovery_data: Dict[str, Any]) -> None:
+    @callback
+    def _process_discovered_network_device(self, discovery_data: Dict[str, Any]) -> None:
         """Process a device discovered via network scanning (mDNS/SSDP)."""
-        async with self._discovery_lock:
-            device_id = discovery_data["device_id"]
-            
-            if await self._is_device_already_configured(device_id):
-                _LOGGER.debug("Network device %s already configured, skipping", device_id)
-                return
+        device_id = discovery_data["device_id"]
+        
+        if self._is_device_already_configured(device_id):
+            _LOGGER.debug("Network device %s already configured, skipping", device_id)
+            return
 
-            if device_id in self._discovered_devices:
-                _LOGGER.debug("Network device %s already discovered, updating info", device_id)
-                self._discovered_devices[device_id].update({
-                    "last_seen": dt_util.utcnow(),
-                    "device_info": discovery_data # Store the raw discovery data
-                })
-                # Optionally, re-notify if details changed significantly
-                return
+        now = dt_util.utcnow()
 
-            # New network device discovered
-            # Adapt the discovery_data structure as needed for config_flow
-            # This might differ from MQTT's structure
-            processed_data = {
-                "device_id": device_id,
-                "name": discovery_data.get("name", f"UFO-R11 {device_id[:8]}"),
-                "host": discovery_data.get("host"), # From Zeroconf/SSDP
-                "port": discovery_data.get("port"), # From Zeroconf/SSDP
-                "properties": discovery_data.get("properties"), # Zeroconf specific
-                "ssdp_info": discovery_data.get("ssdp_info"), # SSDP specific
-                "discovery_source": discovery_data.get("discovery_source"),
-                "device_type": DEVICE_TYPE_AC, # Default or determine from discovery
-                "code_source": CODE_SOURCE_POINTCODES, # Default or determine
-                "discovered_at": dt_util.utcnow(),
-                "last_seen": dt_util.utcnow(),
-                "manufacturer": discovery_data.get("manufacturer", MANUFACTURER),
-                "model": discovery_data.get("model", MODEL),
-            }
-            
-            self._discovered_devices[device_id] = processed_data
-            
-            _LOGGER.info("Discovered new UFO-R11 via %s: %s (%s)",
-                         discovery_data.get("discovery_source", "network"),
-                         processed_data['name'], device_id)
-            
-            await self._notify_device_discovered(processed_data)
\ No newline at end of file
+        # Store the raw discovery data for already discovered devices
+        if self._touch_discovered_device(device_id, discovery_data, now):
+            _LOGGER.debug("Network device %s already discovered, updated info", device_id)
+            # Optionally, re-notify if details changed significantly
+            return
+
+        # New network device discovered
+        # Adapt the discovery_data structure as needed for config_flow
+        # This might differ from MQTT's structure
+        processed_data = {
+            "device_id": device_id,
+            "name": discovery_data.get("name", f"UFO-R11 {device_id[:8]}"),
+            "host": discovery_data.get("host"), # From Zeroconf/SSDP
+            "port": discovery_data.get("port"), # From Zeroconf/SSDP
+            "properties": discovery_data.get("properties"), # Zeroconf specific
+            "ssdp_info": discovery_data.get("ssdp_info"), # SSDP specific
+            "discovery_source": discovery_data.get("discovery_source"),
+            "device_type": DEVICE_TYPE_AC, # Default or determine from discovery
+            "code_source": CODE_SOURCE_POINTCODES, # Default or determine
+            "discovered_at": now,
+            "last_seen": now,
+            "last_seen_monotonic": time.monotonic(),
+            "manufacturer": discovery_data.get("manufacturer", MANUFACTURER),
+            "model": discovery_data.get("model", MODEL),
+        }
+        
+        self._store_discovered_device(device_id, processed_data)
+        
+        _LOGGER.info("Discovered new UFO-R11 via %s: %s (%s)",
+                     discovery_data.get("discovery_source", "network"),
+                     processed_data['name'], device_id)
+        
+        self._notify_devices_discovered([processed_data])
\ No newline at end of file
@@ -1,16 +1,128 @@
 """Frontend panel registration for UFO-R11 SmartIR integration."""
 from __future__ import annotations
 
+import asyncio
+import gzip
 import logging
+import mimetypes
 from pathlib import Path
+from typing import Any, Dict
 
+from aiohttp import hdrs, web
 from homeassistant.components import frontend, panel_custom
+from homeassistant.components.http import HomeAssistantView
 from homeassistant.core import HomeAssistant
+from homeassistant.loader import async_get_integration
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Versioned assets never change for a given release, so browsers may keep them
+_CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+# Unversioned requests (e.g. relative URLs from index.html) must revalidate
+_CACHE_REVALIDATE = "no-cache"
+_IMMUTABLE_SUFFIXES = (".js", ".css", ".woff2")
+# Preferred order when the browser accepts several encodings
+_ENCODINGS = ("br", "gzip")
+
+# Resolve the panel registration APIs once; they differ between HA releases
+_REGISTER_BUILT_IN_PANEL = getattr(frontend, "async_register_built_in_panel", None)
+_BUILT_IN_PANEL_IS_COROUTINE = asyncio.iscoroutinefunction(_REGISTER_BUILT_IN_PANEL)
+_REGISTER_CUSTOM_PANEL = getattr(panel_custom, "async_register_panel", None)
+
+
+def _load_static_files(www_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Read the www directory into memory with precompressed variants and ETags."""
+    files = {}
+    for path in www_path.iterdir():
+        if not path.is_file():
+            continue
+        st = path.stat()
+        data = path.read_bytes()
+        etag = f"{int(st.st_mtime)}-{st.st_size}"
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        bodies = {"identity": data, "gzip": gzip.compress(data, 9)}
+        if brotli is not None:
+            bodies["br"] = brotli.compress(data, quality=11)
+        files[path.name] = {
+            "content_type": content_type,
+            # Each encoding is a different representation and needs its own ETag
+            "variants": {
+                encoding: (body, f'"{etag}-{encoding}"' if encoding != "identity" else f'"{etag}"')
+                for encoding, body in bodies.items()
+            },
+        }
+    return files
+
+
+def _select_encoding(accept_encoding: str, variants: Dict[str, Any]) -> str:
+    """Pick the best precompressed variant the client accepts."""
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    for encoding in _ENCODINGS:
+        if encoding in variants and encoding in accepted:
+            return encoding
+    return "identity"
+
+
+class PanelStaticView(HomeAssistantView):
+    """Serve the panel's static assets from memory with long-lived cache headers."""
+    
+    url = f"/api/{DOMAIN}/static/{{filename}}"
+    name = f"api:{DOMAIN}:static"
+    requires_auth = False
+    
+    def __init__(self, files: Dict[str, Dict[str, Any]]) -> None:
+        """Initialize the view with the preloaded static files."""
+        self._files = files
+    
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
+        """Serve a static panel file."""
+        entry = self._files.get(filename)
+        if entry is None:
+            raise web.HTTPNotFound()
+        
+        variants = entry["variants"]
+        encoding = _select_encoding(request.headers.get(hdrs.ACCEPT_ENCODING, ""), variants)
+        body, etag = variants[encoding]
+        
+        if "v" in request.query and filename.endswith(_IMMUTABLE_SUFFIXES):
+            cache_control = _CACHE_IMMUTABLE
+        else:
+            cache_control = _CACHE_REVALIDATE
+        headers = {
+            hdrs.CACHE_CONTROL: cache_control,
+            hdrs.ETAG: etag,
+            hdrs.VARY: hdrs.ACCEPT_ENCODING,
+        }
+        
+        # ETags are computed at registration, so revalidation never touches disk
+        if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+        if if_none_match and (
+            if_none_match.strip() == "*"
+            or etag in (tag.strip() for tag in if_none_match.split(","))
+        ):
+            return web.Response(status=304, headers=headers)
+        
+        if encoding != "identity":
+            headers[hdrs.CONTENT_ENCODING] = encoding
+        return web.Response(body=body, content_type=entry["content_type"], headers=headers)
+
 
 async def async_register_panel(hass: HomeAssistant) -> None:
     """Register the UFO-R11 SmartIR frontend panel."""
@@ -18,21 +130,21 @@ async def async_register_panel(hass: HomeAssistant) -> None:
         # Get the path to our www directory
         www_path = Path(__file__).parent / "www"
         
-        # Register the static files directory
-        hass.http.register_static_path(
-            f"/api/{DOMAIN}/static",
-            str(www_path),
-            cache_headers=True
-        )
+        # Serve the static files directory; asset URLs carry the release version
+        # so the browser can cache them for good and refetch after an upgrade
+        files = await hass.async_add_executor_job(_load_static_files, www_path)
+        hass.http.register_view(PanelStaticView(files))
+        integration = await async_get_integration(hass, DOMAIN)
+        version = integration.version or "0"
         
         # Register the frontend panel
         panel_registered_successfully = False
         
         # Register using the built-in 'custom' panel mechanism
-        if hasattr(frontend, "async_register_built_in_panel") and frontend.async_register_built_in_panel:
+        if _REGISTER_BUILT_IN_PANEL:
             _LOGGER.debug("Attempting to register panel using async_register_built_in_panel")
             try:
-                await frontend.async_register_built_in_panel(
+                result = _REGISTER_BUILT_IN_PANEL(
                     hass,
                     component_name="custom",
                     sidebar_title="UFO-R11 SmartIR",
@@ -41,12 +153,15 @@ async def async_register_panel(hass: HomeAssistant) -> None:
                     config={
                         "_panel_custom": {
                             "name": f"panel-custom-{DOMAIN.replace('_', '-')}",
-                            "js_url": f"/api/{DOMAIN}/static/ufo-r11-panel.js",
-                            "css_url": f"/api/{DOMAIN}/static/ufo-r11-styles.css",
+                            "js_url": f"/api/{DOMAIN}/static/ufo-r11-panel.js?v={version}",
+                            "css_url": f"/api/{DOMAIN}/static/ufo-r11-styles.css?v={version}",
                         },
                     },
                     require_admin=False,
                 )
+                # Newer releases made this a plain callback
+                if _BUILT_IN_PANEL_IS_COROUTINE:
+                    await result
                 panel_registered_successfully = True
                 _LOGGER.info("Panel registered using async_register_built_in_panel")
             except Exception as e_builtin:
@@ -55,16 +170,16 @@ async def async_register_panel(hass: HomeAssistant) -> None:
                 )
         
         # If the older method was not available, was None, or failed, try the newer method
-        if not panel_registered_successfully and hasattr(panel_custom, "async_register_panel"):
+        if not panel_registered_successfully and _REGISTER_CUSTOM_PANEL:
             _LOGGER.debug("Attempting to register panel using panel_custom.async_register_panel")
             try:
-                await panel_custom.async_register_panel(
+                await _REGISTER_CUSTOM_PANEL(
                     hass,
                     frontend_url_path=DOMAIN,
                     webcomponent_name=f"panel-custom-{DOMAIN.replace('_', '-')}",
                     sidebar_title="UFO-R11 SmartIR",
                     sidebar_icon="mdi:remote",
-                    module_url=f"/api/{DOMAIN}/static/ufo-r11-panel.js",
+                    module_url=f"/api/{DOMAIN}/static/ufo-r11-panel.js?v={version}",
                     embed_iframe=True,
                     require_admin=False,
                 )
@@ -95,7 +210,8 @@ async def async_register_panel(hass: HomeAssistant) -> None:
 async def async_setup_frontend_panel(hass: HomeAssistant) -> None:
     """Set up the UFO-R11 SmartIR frontend panel."""
     # Check if panel setup has already been successfully completed
-    if hass.data.get(DOMAIN, {}).get("frontend_panel_registered", False):
+    domain_data = hass.data.get(DOMAIN)
+    if domain_data and domain_data.get("frontend_panel_registered"):
         _LOGGER.debug(
             "UFO-R11 SmartIR frontend panel '%s' already marked as registered. Skipping setup.",
             DOMAIN
@@ -1,16 +1,19 @@
 """IR code data models and management for UFO-R11 SmartIR integration."""
 from __future__ import annotations
 
+import asyncio
 import base64
-import json
 import logging
+import os
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Union
 from pathlib import Path
 import aiofiles
 
-from homeassistant.core import HomeAssistant
-from homeassistant.util import dt as dt_util
+from homeassistant.core import HomeAssistant, callback
 
 from .const import (
     DOMAIN,
@@ -30,11 +33,32 @@ from .const import (
     POINTCODES_MIN_TEMP,
     POINTCODES_MAX_TEMP,
 )
+from .json_util import json_dumps, json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
+# Command keys and names ("on", "cool", "17", ...) repeat across every device
+_INTERN = sys.intern
 
-@dataclass
+# Seconds to wait for further changes before writing a device's code file
+_SAVE_DELAY = 1.0
+
+
+def _write_json_file(storage_file: Path, data: Dict[str, Any]) -> None:
+    """Serialize data and atomically replace a JSON file with it."""
+    # Write to a sibling temp file and rename over the target so a crash
+    # mid-write never leaves a truncated JSON file behind
+    tmp_file = storage_file.with_suffix(".json.tmp")
+    tmp_file.write_bytes(json_dumps(data))
+    os.replace(tmp_file, storage_file)
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string with second precision."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@dataclass(slots=True)
 class IRCommand:
     """Represents a single IR command with its encoded data."""
     
@@ -43,11 +67,15 @@ class IRCommand:
     raw_data: Optional[str] = None
     timestamp: Optional[str] = None
     validated: bool = False
+    # Decoded IR data, kept from validation so sending does not decode again
+    _decoded: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    # Code set holding this command, whose caches depend on the validated flag
+    _owner: Optional[IRCodeSet] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Post-initialization validation and processing."""
         if self.timestamp is None:
-            self.timestamp = dt_util.utcnow().isoformat()
+            self.timestamp = _now_iso()
         
         # Validate Base64 encoding
         self.validated = self._validate_base64()
@@ -56,22 +84,21 @@ class IRCommand:
         """Validate that the code is valid Base64 encoding."""
         try:
             # Attempt to decode the Base64 string
-            decoded = base64.b64decode(self.code, validate=True)
-            return len(decoded) > 0
+            self._decoded = base64.b64decode(self.code, validate=True) or None
         except Exception as e:
+            self._decoded = None
             _LOGGER.warning("Invalid Base64 IR code for %s: %s", self.name, str(e))
-            return False
+        return self._decoded is not None
     
     def get_decoded_data(self) -> Optional[bytes]:
         """Get the decoded IR data as bytes."""
-        if not self.validated:
-            return None
-        
-        try:
-            return base64.b64decode(self.code)
-        except Exception as e:
-            _LOGGER.error("Failed to decode IR data for %s: %s", self.name, str(e))
-            return None
+        if self._decoded is None and self.validated:
+            # Commands loaded from storage are decoded on first use
+            self.validated = self._validate_base64()
+            if not self.validated and self._owner is not None:
+                # The stored flag was wrong; drop results built on it
+                self._owner._invalidate_caches()
+        return self._decoded
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert command to dictionary representation."""
@@ -84,121 +111,197 @@ class IRCommand:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> IRCommand:
+    def from_dict(cls, data: Dict[str, Any], timestamp_default: Optional[str] = None) -> IRCommand:
         """Create IRCommand from dictionary."""
         return cls(
-            name=data["name"],
+            name=_INTERN(data["name"]),
             code=data["code"],
             raw_data=data.get("raw_data"),
-            timestamp=data.get("timestamp"),
+            timestamp=data.get("timestamp") or timestamp_default,
             validated=data.get("validated", False),
         )
+    
+    @classmethod
+    def _from_trusted_dict(cls, data: Dict[str, Any], timestamp_default: Optional[str] = None) -> IRCommand:
+        """Create IRCommand from stored data, trusting its validated flag."""
+        command = cls.__new__(cls)
+        command.name = _INTERN(data["name"])
+        command.code = data["code"]
+        command.raw_data = data.get("raw_data")
+        command.timestamp = data.get("timestamp") or timestamp_default
+        command.validated = data.get("validated", False)
+        command._decoded = None
+        command._owner = None
+        return command
 
 
-@dataclass
+@dataclass(slots=True)
 class IRCodeSet:
     """Represents a complete set of IR codes for a device."""
     
+    _CATEGORIES = ("power", "temperature", "mode", "fan_speed", "swing", "custom")
+    _ESSENTIAL_COMMANDS = (
+        ("power", ("on", "off")),
+        ("mode", ("cool",)),
+        ("fan_speed", ("auto",)),
+    )
+    
     device_id: str
     device_name: str
     device_type: str = "air_conditioner"
     manufacturer: str = "MOES"
     model: str = "UFO-R11"
     
-    # Power commands
-    power: Dict[str, IRCommand] = field(default_factory=dict)
-    
-    # Temperature commands (17-30°C)
-    temperature: Dict[str, IRCommand] = field(default_factory=dict)
-    
-    # Mode commands
-    mode: Dict[str, IRCommand] = field(default_factory=dict)
-    
-    # Fan speed commands
-    fan_speed: Dict[str, IRCommand] = field(default_factory=dict)
-    
-    # Swing commands
-    swing: Dict[str, IRCommand] = field(default_factory=dict)
-    
-    # Custom/learned commands
-    custom: Dict[str, IRCommand] = field(default_factory=dict)
-    
     # Metadata
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
     
+    # Commands keyed by category, then by command key
+    _categories: Dict[str, Dict[str, IRCommand]] = field(
+        default_factory=lambda: {category: {} for category in IRCodeSet._CATEGORIES},
+        init=False,
+        repr=False,
+    )
+    # Serialized and validation results, keyed by updated_at and cleared on mutation
+    _dict_cache: Optional[Tuple[Optional[str], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _validation_cache: Optional[Tuple[Optional[str], Dict[str, Tuple[str, ...]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Numeric temperature commands keyed by int, sorted; cleared on mutation
+    _int_temperatures: Optional[Dict[int, IRCommand]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def __post_init__(self):
         """Post-initialization setup."""
+        now = _now_iso()
         if self.created_at is None:
-            self.created_at = dt_util.utcnow().isoformat()
-        self.updated_at = dt_util.utcnow().isoformat()
+            self.created_at = now
+        self.updated_at = now
     
-    def add_command(self, category: str, key: str, command: IRCommand) -> bool:
-        """Add a command to the specified category."""
-        try:
-            category_dict = getattr(self, category, None)
-            if category_dict is None:
-                _LOGGER.error("Invalid category: %s", category)
-                return False
-            
-            category_dict[key] = command
-            self.updated_at = dt_util.utcnow().isoformat()
-            _LOGGER.debug("Added command %s to category %s for device %s", 
-                         command.name, category, self.device_id)
-            return True
-        except Exception as e:
-            _LOGGER.error("Failed to add command %s: %s", command.name, str(e))
+    # Category views are read-only; changes go through add_command/remove_command,
+    # which invalidate the caches
+    @property
+    def power(self) -> Mapping[str, IRCommand]:
+        """Power commands."""
+        return MappingProxyType(self._categories["power"])
+    
+    @property
+    def temperature(self) -> Mapping[str, IRCommand]:
+        """Temperature commands (17-30°C)."""
+        return MappingProxyType(self._categories["temperature"])
+    
+    @property
+    def mode(self) -> Mapping[str, IRCommand]:
+        """Mode commands."""
+        return MappingProxyType(self._categories["mode"])
+    
+    @property
+    def fan_speed(self) -> Mapping[str, IRCommand]:
+        """Fan speed commands."""
+        return MappingProxyType(self._categories["fan_speed"])
+    
+    @property
+    def swing(self) -> Mapping[str, IRCommand]:
+        """Swing commands."""
+        return MappingProxyType(self._categories["swing"])
+    
+    @property
+    def custom(self) -> Mapping[str, IRCommand]:
+        """Custom/learned commands."""
+        return MappingProxyType(self._categories["custom"])
+    
+    def _invalidate_caches(self) -> None:
+        """Drop cached to_dict/validate_commands results after a mutation."""
+        self._dict_cache = None
+        self._validation_cache = None
+        self._int_temperatures = None
+    
+    def add_command(self, category: str, key: str, command: IRCommand, bulk: bool = False) -> bool:
+        """Add a command to the specified category.
+
+        Bulk loaders pass bulk=True and set updated_at once when they are done.
+        """
+        category_dict = self._categories.get(category)
+        if category_dict is None:
+            _LOGGER.error("Invalid category: %s", category)
             return False
+        
+        category_dict[_INTERN(key)] = command
+        command._owner = self
+        self._invalidate_caches()
+        if not bulk:
+            self.updated_at = _now_iso()
+        _LOGGER.debug("Added command %s to category %s for device %s", 
+                     command.name, category, self.device_id)
+        return True
     
     def get_command(self, category: str, key: str) -> Optional[IRCommand]:
         """Get a command from the specified category."""
-        try:
-            category_dict = getattr(self, category, None)
-            if category_dict is None:
-                return None
-            return category_dict.get(key)
-        except Exception as e:
-            _LOGGER.error("Failed to get command %s from %s: %s", key, category, str(e))
+        category_dict = self._categories.get(category)
+        if category_dict is None:
             return None
+        return category_dict.get(key)
     
     def remove_command(self, category: str, key: str) -> bool:
         """Remove a command from the specified category."""
-        try:
-            category_dict = getattr(self, category, None)
-            if category_dict is None or key not in category_dict:
-                return False
-            
-            del category_dict[key]
-            self.updated_at = dt_util.utcnow().isoformat()
-            return True
-        except Exception as e:
-            _LOGGER.error("Failed to remove command %s from %s: %s", key, category, str(e))
+        category_dict = self._categories.get(category)
+        if category_dict is None or category_dict.pop(key, None) is None:
             return False
+        
+        self._invalidate_caches()
+        self.updated_at = _now_iso()
+        return True
     
-    def get_all_commands(self) -> Dict[str, Dict[str, IRCommand]]:
-        """Get all commands organized by category."""
+    def get_all_commands(self) -> Dict[str, Mapping[str, IRCommand]]:
+        """Get read-only views of all commands organized by category."""
         return {
-            "power": self.power,
-            "temperature": self.temperature,
-            "mode": self.mode,
-            "fan_speed": self.fan_speed,
-            "swing": self.swing,
-            "custom": self.custom,
+            category: MappingProxyType(commands)
+            for category, commands in self._categories.items()
         }
     
+    def validated_keys(self, category: str) -> Set[str]:
+        """Get the keys of validated commands in a category."""
+        commands = self._categories.get(category)
+        if commands is None:
+            return set()
+        return {key for key, command in commands.items() if command.validated}
+    
+    def get_temperature_commands(self) -> Mapping[int, IRCommand]:
+        """Get numeric temperature commands keyed by degrees, in ascending order."""
+        if self._int_temperatures is None:
+            temperatures = {}
+            for key, command in self._categories["temperature"].items():
+                if key.isdigit():
+                    # The canonical "17" key wins over variants such as "017"
+                    temp = int(key)
+                    if temp not in temperatures or key == str(temp):
+                        temperatures[temp] = command
+            self._int_temperatures = dict(sorted(temperatures.items()))
+        return MappingProxyType(self._int_temperatures)
+    
     def get_command_count(self) -> int:
         """Get total number of commands in this code set."""
-        return sum(len(commands) for commands in self.get_all_commands().values())
+        return sum(map(len, self._categories.values()))
     
     def validate_commands(self) -> Dict[str, List[str]]:
         """Validate all commands and return validation results."""
+        if self._validation_cache is None or self._validation_cache[0] != self.updated_at:
+            self._validation_cache = (self.updated_at, self._validate_commands())
+        # Hand out fresh lists so callers cannot alter the cached results
+        return {key: list(ids) for key, ids in self._validation_cache[1].items()}
+    
+    def _validate_commands(self) -> Dict[str, Tuple[str, ...]]:
+        """Compute the validation results of all commands."""
         results = {
             "valid": [],
             "invalid": [],
             "missing": [],
         }
         
-        for category, commands in self.get_all_commands().items():
+        for category, commands in self._categories.items():
             for key, command in commands.items():
                 command_id = f"{category}.{key}"
                 if command.validated:
@@ -207,36 +310,36 @@ class IRCodeSet:
                     results["invalid"].append(command_id)
         
         # Check for missing essential commands
-        essential_commands = [
-            ("power", "on"),
-            ("power", "off"),
-            ("mode", "cool"),
-            ("fan_speed", "auto"),
-        ]
+        for category, keys in self._ESSENTIAL_COMMANDS:
+            commands = self._categories[category]
+            results["missing"].extend(f"{category}.{key}" for key in keys if key not in commands)
         
-        for category, key in essential_commands:
-            if not self.get_command(category, key):
-                results["missing"].append(f"{category}.{key}")
-        
-        return results
+        return {key: tuple(ids) for key, ids in results.items()}
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert code set to dictionary representation."""
-        return {
+        """Convert code set to dictionary representation.
+
+        The result is cached and shared between callers until the next change,
+        so it must be treated as read-only.
+        """
+        if self._dict_cache is not None and self._dict_cache[0] == self.updated_at:
+            return self._dict_cache[1]
+        
+        data = {
             "device_id": self.device_id,
             "device_name": self.device_name,
             "device_type": self.device_type,
             "manufacturer": self.manufacturer,
             "model": self.model,
-            "power": {k: v.to_dict() for k, v in self.power.items()},
-            "temperature": {k: v.to_dict() for k, v in self.temperature.items()},
-            "mode": {k: v.to_dict() for k, v in self.mode.items()},
-            "fan_speed": {k: v.to_dict() for k, v in self.fan_speed.items()},
-            "swing": {k: v.to_dict() for k, v in self.swing.items()},
-            "custom": {k: v.to_dict() for k, v in self.custom.items()},
+            **{
+                category: {k: v.to_dict() for k, v in commands.items()}
+                for category, commands in self._categories.items()
+            },
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
+        self._dict_cache = (self.updated_at, data)
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> IRCodeSet:
@@ -250,12 +353,15 @@ class IRCodeSet:
             created_at=data.get("created_at"),
         )
         
-        # Load commands for each category
-        for category in ["power", "temperature", "mode", "fan_speed", "swing", "custom"]:
+        # Load commands for each category, sharing one timestamp for commands without one
+        now = code_set.updated_at
+        for category in cls._CATEGORIES:
             if category in data:
-                category_dict = getattr(code_set, category)
+                category_dict = code_set._categories[category]
                 for key, command_data in data[category].items():
-                    category_dict[key] = IRCommand.from_dict(command_data)
+                    command = IRCommand._from_trusted_dict(command_data, timestamp_default=now)
+                    command._owner = code_set
+                    category_dict[_INTERN(key)] = command
         
         code_set.updated_at = data.get("updated_at")
         return code_set
@@ -269,7 +375,20 @@ class IRCodeManager:
         self.hass = hass
         self._code_sets: Dict[str, IRCodeSet] = {}
         self._storage_path = Path(hass.config.config_dir) / "custom_components" / DOMAIN / "data"
-        self._storage_path.mkdir(parents=True, exist_ok=True)
+        self._storage_ready = False
+        self._dirty: Set[str] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Saves of one device run one at a time so the newest snapshot is written last
+        self._save_locks: Dict[str, asyncio.Lock] = {}
+    
+    async def async_setup(self) -> None:
+        """Create the storage directory without blocking the event loop."""
+        if self._storage_ready:
+            return
+        await self.hass.async_add_executor_job(
+            lambda: self._storage_path.mkdir(parents=True, exist_ok=True)
+        )
+        self._storage_ready = True
     
     async def async_load_device(self, device_id: str) -> Optional[IRCodeSet]:
         """Load IR code set for a device."""
@@ -278,24 +397,44 @@ class IRCodeManager:
         
         # Try to load from storage
         storage_file = self._storage_path / f"{device_id}.json"
-        if storage_file.exists():
-            try:
-                _LOGGER.debug("DEBUG: About to perform NON-BLOCKING async file read on: %s", storage_file)
-                _LOGGER.info("DEBUG: Using aiofiles for non-blocking IR codes file read!")
-                async with aiofiles.open(storage_file, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                    data = json.loads(content)
-                _LOGGER.debug("DEBUG: File read completed successfully")
-                code_set = IRCodeSet.from_dict(data)
-                self._code_sets[device_id] = code_set
-                _LOGGER.info("Loaded IR code set for device %s with %d commands", 
-                           device_id, code_set.get_command_count())
-                return code_set
-            except Exception as e:
-                _LOGGER.error("Failed to load IR codes for device %s: %s", device_id, str(e))
+        try:
+            _LOGGER.debug("DEBUG: About to perform NON-BLOCKING async file read on: %s", storage_file)
+            _LOGGER.debug("DEBUG: Using aiofiles for non-blocking IR codes file read!")
+            async with aiofiles.open(storage_file, 'rb') as f:
+                content = await f.read()
+            # Release the raw bytes before building objects so they are not held alongside
+            data = json_loads(content)
+            del content
+            _LOGGER.debug("DEBUG: File read completed successfully")
+            code_set = IRCodeSet.from_dict(data)
+            del data
+            self._code_sets[device_id] = code_set
+            _LOGGER.info("Loaded IR code set for device %s with %d commands", 
+                       device_id, code_set.get_command_count())
+            return code_set
+        except FileNotFoundError:
+            _LOGGER.debug("No stored IR codes for device %s", device_id)
+        except Exception as e:
+            _LOGGER.error("Failed to load IR codes for device %s: %s", device_id, str(e))
         
         return None
     
+    async def async_load_all_devices(self) -> List[str]:
+        """Load IR code sets for every stored device concurrently."""
+        files = await self.hass.async_add_executor_job(
+            lambda: list(self._storage_path.glob("*.json"))
+        )
+        results = await asyncio.gather(
+            *(self.async_load_device(path.stem) for path in files),
+            return_exceptions=True,
+        )
+        loaded = [
+            path.stem for path, result in zip(files, results)
+            if isinstance(result, IRCodeSet)
+        ]
+        _LOGGER.debug("Loaded IR code sets for %d of %d stored devices", len(loaded), len(files))
+        return loaded
+    
     async def async_save_device(self, device_id: str) -> bool:
         """Save IR code set for a device."""
         if device_id not in self._code_sets:
@@ -303,14 +442,16 @@ class IRCodeManager:
             return False
         
         try:
+            await self.async_setup()
             storage_file = self._storage_path / f"{device_id}.json"
-            code_set = self._code_sets[device_id]
+            lock = self._save_locks.setdefault(device_id, asyncio.Lock())
             
-            _LOGGER.debug("DEBUG: About to perform NON-BLOCKING async file write to: %s", storage_file)
-            _LOGGER.info("DEBUG: Using aiofiles for non-blocking IR codes file write!")
-            async with aiofiles.open(storage_file, 'w', encoding='utf-8') as f:
-                content = json.dumps(code_set.to_dict(), indent=2, ensure_ascii=False)
-                await f.write(content)
+            async with lock:
+                # Snapshot on the event loop; serialize and write in one executor job.
+                # The cached representation is replaced, never mutated, on changes.
+                data = self._code_sets[device_id].to_dict()
+                _LOGGER.debug("DEBUG: About to perform NON-BLOCKING executor file write to: %s", storage_file)
+                await self.hass.async_add_executor_job(_write_json_file, storage_file, data)
             _LOGGER.debug("DEBUG: File write completed successfully")
             
             _LOGGER.info("Saved IR code set for device %s", device_id)
@@ -319,6 +460,29 @@ class IRCodeManager:
             _LOGGER.error("Failed to save IR codes for device %s: %s", device_id, str(e))
             return False
     
+    @callback
+    def async_schedule_save(self, device_id: str) -> None:
+        """Mark a device dirty and save it once changes have settled."""
+        self._dirty.add(device_id)
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_handle = self.hass.loop.call_later(_SAVE_DELAY, self._async_fire_flush)
+    
+    @callback
+    def _async_fire_flush(self) -> None:
+        """Start writing the dirty devices."""
+        self._flush_handle = None
+        self.hass.async_create_task(self.async_flush())
+    
+    async def async_flush(self) -> None:
+        """Write all devices with pending changes."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        dirty, self._dirty = self._dirty, set()
+        if dirty:
+            await asyncio.gather(*(self.async_save_device(device_id) for device_id in dirty))
+    
     def get_device_codes(self, device_id: str) -> Optional[IRCodeSet]:
         """Get IR code set for a device."""
         return self._code_sets.get(device_id)
@@ -337,6 +501,7 @@ class IRCodeManager:
         """Remove IR code set for a device."""
         if device_id in self._code_sets:
             del self._code_sets[device_id]
+            self._save_locks.pop(device_id, None)
             
             # Also remove storage file
             storage_file = self._storage_path / f"{device_id}.json"
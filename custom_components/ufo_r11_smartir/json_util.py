@@ -0,0 +1,18 @@
+"""JSON helpers shared by the UFO-R11 SmartIR integration."""
+from __future__ import annotations
+
+from typing import Any, Union
+
+import orjson
+
+JSONDecodeError = orjson.JSONDecodeError
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
+def json_loads(content: Union[bytes, str]) -> Any:
+    """Deserialize UTF-8 JSON bytes or text."""
+    return orjson.loads(content)
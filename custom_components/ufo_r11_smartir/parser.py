@@ -1,10 +1,12 @@
 """Point-codes file parser for UFO-R11 SmartIR integration."""
 from __future__ import annotations
 
+import io
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 import aiofiles
 
 from .ir_codes import IRCommand, IRCodeSet
@@ -28,6 +30,25 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bound the line numbers reported back for badly malformed files
+_MAX_REPORTED_INVALID_LINES = 100
+
+# Canonical lowercase label prefixes; real Point-codes labels start with one of these
+_LABEL_PREFIXES: Tuple[Tuple[str, Tuple[str, str]], ...] = (
+    ("mode cool", ("mode", "cool")),
+    ("mode dry", ("mode", "dry")),
+    ("mode heat", ("mode", "heat")),
+    ("mode fan", ("mode", "fan_only")),
+    ("mode automatic", ("mode", "auto")),
+    ("mode sleep", ("mode", "sleep")),
+    ("fan speed low", ("fan_speed", "low")),
+    ("fan speed medium", ("fan_speed", "medium")),
+    ("fan speed high", ("fan_speed", "high")),
+    ("fan speed automatic", ("fan_speed", "auto")),
+    ("swing on", ("swing", "on")),
+    ("swing off", ("swing", "off")),
+)
+
 
 class PointCodesParser:
     """Parser for Point-codes file format."""
@@ -48,6 +69,9 @@ class PointCodesParser:
         for temp in range(POINTCODES_MIN_TEMP, POINTCODES_MAX_TEMP + 1):
             mappings[f"{temp}c"] = ("temperature", str(temp))
         
+        # Canonical mode/fan/swing labels, keyed lowercase with single spaces
+        mappings.update(_LABEL_PREFIXES)
+        
         # Mode commands with pattern matching
         mode_patterns = {
             r"Mode\s+cool": ("mode", "cool"),
@@ -72,64 +96,71 @@ class PointCodesParser:
             r"swing\s+off": ("swing", "off"),
         }
         
-        # Store patterns for later matching
-        self._mode_patterns = mode_patterns
-        self._fan_patterns = fan_patterns
-        self._swing_patterns = swing_patterns
+        # Store one compiled alternation for later matching
+        self._label_pattern, self._label_groups = self._compile_patterns(
+            {**mode_patterns, **fan_patterns, **swing_patterns}
+        )
         
         return mappings
     
+    @staticmethod
+    def _compile_patterns(
+        patterns: Dict[str, Tuple[str, str]]
+    ) -> Tuple[re.Pattern, Dict[str, Tuple[str, str]]]:
+        """Compile label patterns into one alternation with a named group per mapping."""
+        groups = {f"{category}_{key}": (category, key) for category, key in patterns.values()}
+        alternation = "|".join(
+            f"(?P<{category}_{key}>{pattern})" for pattern, (category, key) in patterns.items()
+        )
+        return re.compile(alternation, re.IGNORECASE), groups
+    
     def _match_pattern_command(self, label: str) -> Optional[Tuple[str, str]]:
         """Match label against regex patterns for complex commands."""
-        # Try mode patterns
-        for pattern, mapping in self._mode_patterns.items():
-            if re.search(pattern, label, re.IGNORECASE):
+        # Fast path: collapse whitespace and compare canonical prefixes
+        low = " ".join(label.lower().split())
+        for prefix, mapping in _LABEL_PREFIXES:
+            if low.startswith(prefix):
                 return mapping
         
-        # Try fan patterns
-        for pattern, mapping in self._fan_patterns.items():
-            if re.search(pattern, label, re.IGNORECASE):
-                return mapping
-        
-        # Try swing patterns
-        for pattern, mapping in self._swing_patterns.items():
-            if re.search(pattern, label, re.IGNORECASE):
-                return mapping
-        
-        return None
+        # Phrases that do not start the label still go through the regex
+        match = self._label_pattern.search(label)
+        if match is None:
+            return None
+        return self._label_groups[match.lastgroup]
     
-    def _parse_line(self, line: str) -> Optional[Tuple[str, str, str]]:
+    def _parse_line(self, line: str) -> Optional[Tuple[str, str]]:
         """Parse a single line from Point-codes file."""
-        line = line.strip()
-        
-        # Skip empty lines
-        if not line:
+        # Skip empty and comment lines before doing any string work
+        if not line or line[0] in "#\r\n":
             return None
         
-        # Parse format: [Command Label] - [Base64-encoded IR data]
-        if " - " not in line:
-            _LOGGER.warning("Invalid line format: %s", line)
-            return None
+        line = line.rstrip("\r\n")
         
-        parts = line.split(" - ", 1)
-        if len(parts) != 2:
-            _LOGGER.warning("Invalid line format: %s", line)
+        # Parse format: [Command Label] - [Base64-encoded IR data]
+        idx = line.find(" - ")
+        if idx < 0:
+            if line.strip():
+                _LOGGER.warning("Invalid line format: %s", line)
             return None
         
-        label = parts[0].strip()
-        code = parts[1].strip()
+        # Label and code are stripped individually, so the whole line never is
+        label = line[:idx].strip()
+        code = line[idx + 3:].strip()
         
         if not label or not code:
             _LOGGER.warning("Empty label or code in line: %s", line)
             return None
         
-        return label, code, line
+        return label, code
     
     def _map_command(self, label: str) -> Optional[Tuple[str, str]]:
         """Map Point-codes label to category and key."""
-        # Try direct mapping first
-        if label in self._command_mappings:
-            return self._command_mappings[label]
+        # Try direct mapping first, then the normalized canonical label
+        mapping = self._command_mappings.get(label)
+        if mapping is None:
+            mapping = self._command_mappings.get(" ".join(label.lower().split()))
+        if mapping is not None:
+            return mapping
         
         # Try pattern matching for complex commands
         pattern_match = self._match_pattern_command(label)
@@ -139,6 +170,53 @@ class PointCodesParser:
         _LOGGER.warning("Unknown command label: %s", label)
         return None
     
+    def _parse_lines(self, lines: Iterable[str], code_set: IRCodeSet) -> Tuple[int, int]:
+        """Parse Point-codes lines into the code set and return (parsed, skipped) counts."""
+        parsed_commands = 0
+        skipped_commands = 0
+        
+        # Bind hot-path lookups once; this loop runs for every line of every file
+        parse_line = self._parse_line
+        map_command = self._map_command
+        add_command = code_set.add_command
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        
+        for line_num, line in enumerate(lines, 1):
+            parsed_line = parse_line(line)
+            if not parsed_line:
+                continue
+            
+            label, code = parsed_line
+            
+            # Map command to category and key
+            mapping = map_command(label)
+            if not mapping:
+                if debug:
+                    _LOGGER.debug("Skipping unmapped command on line %d: %s", line_num, label)
+                skipped_commands += 1
+                continue
+            
+            category, key = mapping
+            
+            # Create IR command; the source line is just "<name> - <code>", so it
+            # is not kept a second time in raw_data
+            ir_command = IRCommand(
+                name=label,
+                code=code,
+            )
+            
+            # Add to code set; the set was created for this parse, so its
+            # updated_at already reflects the parse time
+            if add_command(category, key, ir_command, bulk=True):
+                parsed_commands += 1
+                if debug:
+                    _LOGGER.debug("Parsed command: %s -> %s.%s", label, category, key)
+            else:
+                _LOGGER.warning("Failed to add command: %s", label)
+                skipped_commands += 1
+        
+        return parsed_commands, skipped_commands
+    
     async def parse_file(self, file_path: str | Path, device_id: str, device_name: str) -> Optional[IRCodeSet]:
         """Parse Point-codes file and create IRCodeSet."""
         try:
@@ -158,45 +236,13 @@ class PointCodesParser:
                 model="UFO-R11",
             )
             
-            parsed_commands = 0
-            skipped_commands = 0
-            
             _LOGGER.debug("DEBUG: About to perform NON-BLOCKING async file read on: %s", file_path)
             _LOGGER.info("DEBUG: Using aiofiles for non-blocking file operations!")
             async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                _LOGGER.debug("DEBUG: Async file opened successfully, reading lines...")
-                async for line in f:
-                    line_num = getattr(f, '_line_num', 0) + 1
-                    setattr(f, '_line_num', line_num)
-                    parsed_line = self._parse_line(line)
-                    if not parsed_line:
-                        continue
-                    
-                    label, code, original_line = parsed_line
-                    
-                    # Map command to category and key
-                    mapping = self._map_command(label)
-                    if not mapping:
-                        _LOGGER.debug("Skipping unmapped command on line %d: %s", line_num, label)
-                        skipped_commands += 1
-                        continue
-                    
-                    category, key = mapping
-                    
-                    # Create IR command
-                    ir_command = IRCommand(
-                        name=label,
-                        code=code,
-                        raw_data=original_line,
-                    )
-                    
-                    # Add to code set
-                    if code_set.add_command(category, key, ir_command):
-                        parsed_commands += 1
-                        _LOGGER.debug("Parsed command: %s -> %s.%s", label, category, key)
-                    else:
-                        _LOGGER.warning("Failed to add command: %s", label)
-                        skipped_commands += 1
+                # One read instead of an executor round trip per line
+                content = await f.read()
+            
+            parsed_commands, skipped_commands = self._parse_lines(io.StringIO(content, newline=None), code_set)
             
             _LOGGER.info(
                 "Point-codes parsing complete. Parsed: %d, Skipped: %d, Total commands: %d",
@@ -240,39 +286,7 @@ class PointCodesParser:
                 model="UFO-R11",
             )
             
-            parsed_commands = 0
-            skipped_commands = 0
-            
-            for line_num, line in enumerate(content.splitlines(), 1):
-                parsed_line = self._parse_line(line)
-                if not parsed_line:
-                    continue
-                
-                label, code, original_line = parsed_line
-                
-                # Map command to category and key
-                mapping = self._map_command(label)
-                if not mapping:
-                    _LOGGER.debug("Skipping unmapped command on line %d: %s", line_num, label)
-                    skipped_commands += 1
-                    continue
-                
-                category, key = mapping
-                
-                # Create IR command
-                ir_command = IRCommand(
-                    name=label,
-                    code=code,
-                    raw_data=original_line,
-                )
-                
-                # Add to code set
-                if code_set.add_command(category, key, ir_command):
-                    parsed_commands += 1
-                    _LOGGER.debug("Parsed command: %s -> %s.%s", label, category, key)
-                else:
-                    _LOGGER.warning("Failed to add command: %s", label)
-                    skipped_commands += 1
+            parsed_commands, skipped_commands = self._parse_lines(io.StringIO(content, newline=None), code_set)
             
             _LOGGER.info(
                 "Point-codes parsing complete. Parsed: %d, Skipped: %d, Total commands: %d",
@@ -318,27 +332,29 @@ class PointCodesParser:
                     total_lines += 1
                     
                     # Check format: [Command Label] - [Base64-encoded IR data]
-                    if " - " in line:
-                        parts = line.split(" - ", 1)
-                        if len(parts) == 2 and parts[0].strip() and parts[1].strip():
-                            valid_lines += 1
-                        else:
-                            invalid_lines.append(line_num)
-                    else:
+                    # The line is stripped, so text on both sides of the separator
+                    # is non-blank whenever it is not at either end
+                    idx = line.find(" - ")
+                    if idx > 0 and idx + 3 < len(line):
+                        valid_lines += 1
+                    elif len(invalid_lines) < _MAX_REPORTED_INVALID_LINES:
                         invalid_lines.append(line_num)
             
+            invalid_count = total_lines - valid_lines
             return {
-                "valid": len(invalid_lines) == 0,
+                "valid": invalid_count == 0,
                 "total_lines": total_lines,
                 "valid_lines": valid_lines,
                 "invalid_lines": invalid_lines,
-                "error": None if len(invalid_lines) == 0 else f"Invalid format on lines: {invalid_lines}",
+                "error": None if invalid_count == 0 else f"Invalid format on lines: {invalid_lines}",
             }
             
         except Exception as e:
             return {"valid": False, "error": str(e)}
 
 
+# The parser only holds its label tables, so every caller can share one instance
+@lru_cache(maxsize=1)
 def create_pointcodes_parser() -> PointCodesParser:
     """Create and return a Point-codes parser instance."""
     return PointCodesParser()
\ No newline at end of file
@@ -1,10 +1,12 @@
 """SmartIR JSON configuration generator for UFO-R11 SmartIR integration."""
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 from datetime import datetime
 
 from homeassistant.core import HomeAssistant
@@ -14,7 +16,8 @@ from homeassistant.const import (
 # Removed unused imports from homeassistant.components.climate.const
 # The non-existent enums were causing import errors and were not used
 
-from .ir_codes import IRCodeSet, IRCodeManager
+from .ir_codes import IRCommand, IRCodeSet, IRCodeManager
+from .json_util import json_dumps
 from .const import (
     DOMAIN,
     MANUFACTURER,
@@ -41,6 +44,71 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on devices generated at once by async_generate_bulk_configs
+_BULK_CONCURRENCY = 8
+
+# Top-level keys every SmartIR climate configuration must have
+_REQUIRED_SMARTIR_FIELDS = (
+    "manufacturer", "supportedModels", "commandsEncoding",
+    "minTemperature", "maxTemperature", "precision",
+    "operationModes", "commands",
+)
+
+# Internal mode names mapped to SmartIR names; shared, read-only
+_HVAC_MODE_MAPPING: Mapping[str, str] = MappingProxyType({
+    "cool": "cool",
+    "heat": "heat",
+    "dry": "dry",
+    "fan_only": "fan_only",
+    "auto": "auto",
+    "sleep": "auto",  # Map sleep to auto for SmartIR compatibility
+})
+
+_FAN_MODE_MAPPING: Mapping[str, str] = MappingProxyType({
+    "low": "low",
+    "medium": "medium",
+    "high": "high",
+    "auto": "auto",
+})
+
+_SWING_MODE_MAPPING: Mapping[str, str] = MappingProxyType({
+    "off": "off",
+    "on": "vertical",  # Map "on" to "vertical" for SmartIR
+})
+
+
+@dataclass(slots=True)
+class _ValidatedCommands:
+    """Validated commands of a code set, keyed by internal name."""
+    
+    modes: Dict[str, IRCommand]
+    fans: Dict[str, IRCommand]
+    swings: Dict[str, IRCommand]
+    # Every numeric temperature key, sorted, and the codes of the validated ones
+    temps: List[int]
+    temp_codes: Dict[int, str]
+
+
+def _write_config_to_dir(output_dir: Path, device_id: str, content: bytes) -> Path:
+    """Write a serialized SmartIR configuration into an existing directory."""
+    filename = f"smartir_{device_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output_file = output_dir / filename
+    output_file.write_bytes(content)
+    return output_file
+
+
+def _write_config_file(output_file: Path, device_id: str, content: bytes) -> Path:
+    """Write a serialized SmartIR configuration and return the file written."""
+    # Ensure directory exists
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Generate filename if directory provided
+    if output_file.is_dir():
+        return _write_config_to_dir(output_file, device_id, content)
+    
+    output_file.write_bytes(content)
+    return output_file
+
 
 class SmartIRGenerator:
     """Generate SmartIR-compatible JSON configurations from UFO-R11 IR codes."""
@@ -50,147 +118,116 @@ class SmartIRGenerator:
         self.hass = hass
         self._ir_manager = IRCodeManager(hass)
     
-    def _get_hvac_mode_mapping(self) -> Dict[str, str]:
+    def _get_hvac_mode_mapping(self) -> Mapping[str, str]:
         """Get mapping from internal HVAC modes to SmartIR format."""
-        return {
-            "cool": "cool",
-            "heat": "heat", 
-            "dry": "dry",
-            "fan_only": "fan_only",
-            "auto": "auto",
-            "sleep": "auto",  # Map sleep to auto for SmartIR compatibility
-        }
+        return _HVAC_MODE_MAPPING
     
-    def _get_fan_mode_mapping(self) -> Dict[str, str]:
+    def _get_fan_mode_mapping(self) -> Mapping[str, str]:
         """Get mapping from internal fan modes to SmartIR format."""
-        return {
-            "low": "low",
-            "medium": "medium", 
-            "high": "high",
-            "auto": "auto",
-        }
+        return _FAN_MODE_MAPPING
     
-    def _get_swing_mode_mapping(self) -> Dict[str, str]:
+    def _get_swing_mode_mapping(self) -> Mapping[str, str]:
         """Get mapping from internal swing modes to SmartIR format."""
-        return {
-            "off": "off",
-            "on": "vertical",  # Map "on" to "vertical" for SmartIR
-        }
+        return _SWING_MODE_MAPPING
     
-    def _build_temperature_commands(self, code_set: IRCodeSet) -> Dict[str, Any]:
+    def _collect_validated(self, code_set: IRCodeSet) -> _ValidatedCommands:
+        """Walk the code set once and collect the validated commands SmartIR needs."""
+        def validated(
+            category: str, commands: Mapping[str, IRCommand], mapping: Mapping[str, str]
+        ) -> Dict[str, IRCommand]:
+            # Keep mapping order so the generated mode lists stay stable
+            keys = code_set.validated_keys(category)
+            return {name: commands[name] for name in mapping if name in keys}
+        
+        temperatures = code_set.get_temperature_commands()
+        
+        return _ValidatedCommands(
+            modes=validated("mode", code_set.mode, self._get_hvac_mode_mapping()),
+            fans=validated("fan_speed", code_set.fan_speed, self._get_fan_mode_mapping()),
+            swings=validated("swing", code_set.swing, self._get_swing_mode_mapping()),
+            temps=list(temperatures),
+            temp_codes={
+                temp: command.code for temp, command in temperatures.items() if command.validated
+            },
+        )
+    
+    def _build_temperature_commands(self, commands: _ValidatedCommands) -> Dict[str, Any]:
         """Build temperature command structure for SmartIR."""
         temp_commands = {}
         
         # Get all available temperatures
-        available_temps = sorted([int(temp) for temp in code_set.temperature.keys() if temp.isdigit()])
+        available_temps = commands.temps
         
         if not available_temps:
             _LOGGER.warning("No temperature commands found in code set")
             return temp_commands
         
-        min_temp = min(available_temps)
-        max_temp = max(available_temps)
-        
-        _LOGGER.info("Temperature range: %d°C - %d°C", min_temp, max_temp)
+        _LOGGER.info("Temperature range: %d°C - %d°C", available_temps[0], available_temps[-1])
         
         # Build temperature commands for each mode
         hvac_mapping = self._get_hvac_mode_mapping()
+        # Resolve each temperature's key and explicit code once, not once per mode
+        temp_entries = [(str(temp), commands.temp_codes.get(temp)) for temp in available_temps]
         
-        for internal_mode, smartir_mode in hvac_mapping.items():
-            mode_command = code_set.get_command("mode", internal_mode)
-            if not mode_command or not mode_command.validated:
-                continue
-                
-            temp_commands[smartir_mode] = {}
-            
-            # For each temperature, use the mode command
-            # In SmartIR, each temperature/mode combination needs a specific command
-            for temp in available_temps:
-                temp_command = code_set.get_command("temperature", str(temp))
-                if temp_command and temp_command.validated:
-                    # Use temperature-specific command
-                    temp_commands[smartir_mode][str(temp)] = temp_command.code
-                else:
-                    # Fallback to mode command (less ideal but functional)
-                    temp_commands[smartir_mode][str(temp)] = mode_command.code
+        for internal_mode, mode_command in commands.modes.items():
+            # In SmartIR, each temperature/mode combination needs a specific command;
+            # fall back to the mode command (less ideal but functional)
+            mode_code = mode_command.code
+            temp_commands[hvac_mapping[internal_mode]] = {
+                temp_key: mode_code if code is None else code
+                for temp_key, code in temp_entries
+            }
         
         return temp_commands
     
-    def _build_fan_commands(self, code_set: IRCodeSet) -> Dict[str, str]:
+    def _build_fan_commands(self, commands: _ValidatedCommands) -> Dict[str, str]:
         """Build fan speed command structure for SmartIR."""
-        fan_commands = {}
         fan_mapping = self._get_fan_mode_mapping()
-        
-        for internal_fan, smartir_fan in fan_mapping.items():
-            fan_command = code_set.get_command("fan_speed", internal_fan)
-            if fan_command and fan_command.validated:
-                fan_commands[smartir_fan] = fan_command.code
-        
-        return fan_commands
+        return {fan_mapping[internal_fan]: command.code for internal_fan, command in commands.fans.items()}
     
-    def _build_swing_commands(self, code_set: IRCodeSet) -> Dict[str, str]:
+    def _build_swing_commands(self, commands: _ValidatedCommands) -> Dict[str, str]:
         """Build swing command structure for SmartIR."""
-        swing_commands = {}
         swing_mapping = self._get_swing_mode_mapping()
-        
-        for internal_swing, smartir_swing in swing_mapping.items():
-            swing_command = code_set.get_command("swing", internal_swing)
-            if swing_command and swing_command.validated:
-                swing_commands[smartir_swing] = swing_command.code
-        
-        return swing_commands
+        return {
+            swing_mapping[internal_swing]: command.code
+            for internal_swing, command in commands.swings.items()
+        }
     
-    def _get_supported_modes(self, code_set: IRCodeSet) -> List[str]:
+    def _get_supported_modes(self, commands: _ValidatedCommands) -> List[str]:
         """Get list of supported HVAC modes."""
         supported_modes = ["off"]  # Always include off
         hvac_mapping = self._get_hvac_mode_mapping()
         
-        for internal_mode, smartir_mode in hvac_mapping.items():
-            mode_command = code_set.get_command("mode", internal_mode)
-            if mode_command and mode_command.validated:
-                if smartir_mode not in supported_modes:
-                    supported_modes.append(smartir_mode)
+        for internal_mode in commands.modes:
+            smartir_mode = hvac_mapping[internal_mode]
+            if smartir_mode not in supported_modes:
+                supported_modes.append(smartir_mode)
         
         return supported_modes
     
-    def _get_supported_fan_modes(self, code_set: IRCodeSet) -> List[str]:
+    def _get_supported_fan_modes(self, commands: _ValidatedCommands) -> List[str]:
         """Get list of supported fan modes."""
-        supported_modes = []
         fan_mapping = self._get_fan_mode_mapping()
-        
-        for internal_fan, smartir_fan in fan_mapping.items():
-            fan_command = code_set.get_command("fan_speed", internal_fan)
-            if fan_command and fan_command.validated:
-                supported_modes.append(smartir_fan)
-        
-        return supported_modes
+        return [fan_mapping[internal_fan] for internal_fan in commands.fans]
     
-    def _get_supported_swing_modes(self, code_set: IRCodeSet) -> List[str]:
+    def _get_supported_swing_modes(self, commands: _ValidatedCommands) -> List[str]:
         """Get list of supported swing modes."""
-        supported_modes = []
         swing_mapping = self._get_swing_mode_mapping()
-        
-        for internal_swing, smartir_swing in swing_mapping.items():
-            swing_command = code_set.get_command("swing", internal_swing)
-            if swing_command and swing_command.validated:
-                supported_modes.append(smartir_swing)
-        
-        return supported_modes
+        return [swing_mapping[internal_swing] for internal_swing in commands.swings]
     
-    def _get_temperature_range(self, code_set: IRCodeSet) -> tuple[int, int]:
+    def _get_temperature_range(self, commands: _ValidatedCommands) -> tuple[int, int]:
         """Get temperature range from code set."""
-        available_temps = [int(temp) for temp in code_set.temperature.keys() if temp.isdigit()]
-        
-        if available_temps:
-            return min(available_temps), max(available_temps)
+        if commands.temps:
+            return commands.temps[0], commands.temps[-1]
         else:
             return POINTCODES_MIN_TEMP, POINTCODES_MAX_TEMP
     
     async def async_generate_smartir_config(
         self,
         device_id: str,
-        output_path: Optional[str] = None,
-        device_code: Optional[int] = None
+        output_path: Optional[str | Path] = None,
+        device_code: Optional[int] = None,
+        output_is_dir: bool = False,
     ) -> Optional[Dict[str, Any]]:
         """Generate SmartIR configuration for a device."""
         try:
@@ -219,8 +256,11 @@ class SmartIRGenerator:
                 _LOGGER.error("Missing or invalid power off command")
                 return None
             
+            # Collect validated commands once for all SmartIR sections
+            commands = self._collect_validated(code_set)
+            
             # Get temperature range
-            min_temp, max_temp = self._get_temperature_range(code_set)
+            min_temp, max_temp = self._get_temperature_range(commands)
             
             # Build SmartIR configuration
             config = {
@@ -231,15 +271,15 @@ class SmartIRGenerator:
                 "minTemperature": min_temp,
                 "maxTemperature": max_temp,
                 "precision": 1.0,
-                "operationModes": self._get_supported_modes(code_set),
-                "fanModes": self._get_supported_fan_modes(code_set),
-                "swingModes": self._get_supported_swing_modes(code_set),
+                "operationModes": self._get_supported_modes(commands),
+                "fanModes": self._get_supported_fan_modes(commands),
+                "swingModes": self._get_supported_swing_modes(commands),
                 "commands": {
                     "off": power_off.code,
                     "on": power_on.code,
-                    "temperature": self._build_temperature_commands(code_set),
-                    "fanSpeed": self._build_fan_commands(code_set),
-                    "swing": self._build_swing_commands(code_set),
+                    "temperature": self._build_temperature_commands(commands),
+                    "fanSpeed": self._build_fan_commands(commands),
+                    "swing": self._build_swing_commands(commands),
                 }
             }
             
@@ -262,7 +302,7 @@ class SmartIRGenerator:
             
             # Save to file if path provided
             if output_path:
-                await self._save_config_file(config, output_path, device_id)
+                await self._save_config_file(config, output_path, device_id, output_is_dir)
             
             _LOGGER.info("SmartIR configuration generated successfully for device %s", device_id)
             return config
@@ -274,24 +314,19 @@ class SmartIRGenerator:
     async def _save_config_file(
         self,
         config: Dict[str, Any],
-        output_path: str,
-        device_id: str
+        output_path: str | Path,
+        device_id: str,
+        output_is_dir: bool = False,
     ) -> bool:
         """Save SmartIR configuration to file."""
         try:
-            output_file = Path(output_path)
-            
-            # Ensure directory exists
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Generate filename if directory provided
-            if output_file.is_dir():
-                filename = f"smartir_{device_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                output_file = output_file / filename
-            
-            # Write configuration
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            # Serialize once up front; the blocking filesystem work runs in the executor
+            content = json_dumps(config)
+            # Callers that already created the target directory skip the mkdir/is_dir probes
+            writer = _write_config_to_dir if output_is_dir else _write_config_file
+            output_file = await self.hass.async_add_executor_job(
+                writer, Path(output_path), device_id, content
+            )
             
             _LOGGER.info("SmartIR configuration saved to %s", output_file)
             return True
@@ -310,25 +345,38 @@ class SmartIRGenerator:
         
         try:
             output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
+            await self.hass.async_add_executor_job(
+                lambda: output_path.mkdir(parents=True, exist_ok=True)
+            )
             
+            await self._ir_manager.async_load_all_devices()
             devices = self._ir_manager.get_all_devices()
             if device_filter:
-                devices = [d for d in devices if d in device_filter]
+                wanted = set(device_filter)
+                devices = [d for d in devices if d in wanted]
             
             _LOGGER.info("Generating SmartIR configs for %d devices", len(devices))
             
-            for device_id in devices:
-                try:
-                    config = await self.async_generate_smartir_config(
+            # Devices are independent, so overlap their loads and writes
+            semaphore = asyncio.Semaphore(_BULK_CONCURRENCY)
+            
+            async def generate(device_id: str) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    return await self.async_generate_smartir_config(
                         device_id=device_id,
-                        output_path=str(output_path)
+                        output_path=output_path,
+                        output_is_dir=True,
                     )
-                    results[device_id] = config is not None
-                    
-                except Exception as e:
-                    _LOGGER.error("Failed to generate config for device %s: %s", device_id, str(e))
+            
+            configs = await asyncio.gather(
+                *(generate(device_id) for device_id in devices), return_exceptions=True
+            )
+            for device_id, config in zip(devices, configs):
+                if isinstance(config, Exception):
+                    _LOGGER.error("Failed to generate config for device %s: %s", device_id, str(config))
                     results[device_id] = False
+                else:
+                    results[device_id] = config is not None
             
             successful = sum(1 for success in results.values() if success)
             _LOGGER.info("Generated %d/%d SmartIR configurations successfully", 
@@ -349,30 +397,19 @@ class SmartIRGenerator:
         }
         
         # Required fields
-        required_fields = [
-            "manufacturer", "supportedModels", "commandsEncoding",
-            "minTemperature", "maxTemperature", "precision",
-            "operationModes", "commands"
-        ]
-        
-        for field in required_fields:
-            if field not in config:
-                validation["errors"].append(f"Missing required field: {field}")
-                validation["valid"] = False
+        missing = [field for field in _REQUIRED_SMARTIR_FIELDS if field not in config]
+        if missing:
+            validation["errors"].extend(f"Missing required field: {field}" for field in missing)
+            validation["valid"] = False
         
         # Validate commands structure
-        if "commands" in config:
-            commands = config["commands"]
-            
+        commands = config.get("commands")
+        if commands is not None:
             # Check for required command categories
             if "off" not in commands:
                 validation["errors"].append("Missing power off command")
                 validation["valid"] = False
             
-            if "temperature" not in commands or not commands["temperature"]:
-                validation["errors"].append("Missing temperature commands")
-                validation["valid"] = False
-            
             # Validate temperature commands structure
             if "temperature" in commands:
                 temp_commands = commands["temperature"]
@@ -384,6 +421,16 @@ class SmartIRGenerator:
                         if not isinstance(temps, dict):
                             validation["warnings"].append(f"Temperature commands for mode {mode} should be a dictionary")
         
+        self._validate_config_values(config, validation)
+        return validation
+    
+    def _validate_config_values(self, config: Dict[str, Any], validation: Dict[str, Any]) -> None:
+        """Validate the parts of a SmartIR configuration that depend on the IR codes."""
+        commands = config.get("commands")
+        if commands is not None and not commands.get("temperature"):
+            validation["errors"].append("Missing temperature commands")
+            validation["valid"] = False
+        
         # Validate temperature range
         if "minTemperature" in config and "maxTemperature" in config:
             min_temp = config["minTemperature"]
@@ -395,8 +442,6 @@ class SmartIRGenerator:
             
             if min_temp < 0 or max_temp > 50:
                 validation["warnings"].append("Temperature range seems unusual (0-50°C expected)")
-        
-        return validation
     
     async def async_export_device_smartir(
         self,
@@ -413,8 +458,13 @@ class SmartIRGenerator:
             )
             
             if config:
-                # Validate generated config
-                validation = self.validate_smartir_config(config)
+                # Our generator always emits the required structure, so only the
+                # code-dependent values need checking outside of debugging
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    validation = self.validate_smartir_config(config)
+                else:
+                    validation = {"valid": True, "errors": [], "warnings": []}
+                    self._validate_config_values(config, validation)
                 if not validation["valid"]:
                     _LOGGER.error("Generated SmartIR config is invalid: %s", validation["errors"])
                     return False
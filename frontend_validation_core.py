@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Single analysis pass shared by the frontend panel validation scripts."""
+
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+from _validation_cache import extract_symbols, load_source, scan_dir, scan_literals
+
+COMPONENT_DIR = Path("custom_components/ufo_r11_smartir")
+FRONTEND_PANEL_PATH = COMPONENT_DIR / "frontend_panel.py"
+INIT_PATH = COMPONENT_DIR / "__init__.py"
+
+# Panel helpers are expected to take exactly this argument list
+_HASS_SIGNATURE = "hass: HomeAssistant"
+
+
+@dataclass(slots=True, frozen=True)
+class Analysis:
+    """Every signal the frontend validators check, from one read of each file."""
+
+    functions: tuple
+    has_async_setup_frontend_panel: bool
+    has_async_register_panel: bool
+    has_async_unregister_panel: bool
+    setup_calls_register: bool
+    has_error_handling: bool
+    imports_setup: bool
+    imports_register: bool
+    imports_unregister: bool
+    calls_setup: bool
+    calls_register: bool
+    calls_unregister: bool
+
+
+@cache
+def component_entries() -> dict:
+    """List the integration directory once; presence checks and stats reuse it."""
+    return scan_dir(COMPONENT_DIR)
+
+
+@cache
+def analyze() -> Analysis:
+    """Read and parse frontend_panel.py and __init__.py once and collect all signals."""
+    entries = component_entries()
+    content, tree = load_source(FRONTEND_PANEL_PATH, entries.get(FRONTEND_PANEL_PATH.name))
+    symbols = extract_symbols(tree)
+    async_defs = symbols["async_defs"]
+    found = scan_literals(content, ("try:", "except Exception as e:"))
+    
+    _, init_tree = load_source(INIT_PATH, entries.get(INIT_PATH.name))
+    init_symbols = extract_symbols(init_tree)
+    init_imports = init_symbols["imports"]
+    init_calls = init_symbols["calls"]
+    
+    return Analysis(
+        functions=(*symbols["defs"], *async_defs),
+        has_async_setup_frontend_panel=async_defs.get("async_setup_frontend_panel") == _HASS_SIGNATURE,
+        has_async_register_panel=async_defs.get("async_register_panel") == _HASS_SIGNATURE,
+        has_async_unregister_panel=async_defs.get("async_unregister_panel") == _HASS_SIGNATURE,
+        setup_calls_register="await async_register_panel(hass)" in symbols["calls"],
+        has_error_handling=found["try:"] and found["except Exception as e:"],
+        imports_setup=(".frontend_panel", "async_setup_frontend_panel") in init_imports,
+        imports_register=(".frontend_panel", "async_register_panel") in init_imports,
+        imports_unregister=(".frontend_panel", "async_unregister_panel") in init_imports,
+        calls_setup="await async_setup_frontend_panel(hass)" in init_calls,
+        calls_register="await async_register_panel(hass)" in init_calls,
+        calls_unregister="await async_unregister_panel(hass)" in init_calls,
+    )
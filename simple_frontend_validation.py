@@ -1,59 +1,49 @@
 #!/usr/bin/env python3
 """Simple validation script for frontend panel import structure."""
 
-import ast
 import sys
-from pathlib import Path
+
+from frontend_validation_core import FRONTEND_PANEL_PATH, INIT_PATH, analyze, component_entries
+
+# Panel helpers frontend_panel.py is expected to define
+_REQUIRED_FUNCS = frozenset({"async_register_panel", "async_setup_frontend_panel"})
 
 def validate_frontend_panel_structure():
     """Validate the frontend panel module structure."""
     
     print("=== Frontend Panel Import Structure Validation ===\n")
     
-    # Read and parse the frontend_panel.py file
-    frontend_panel_path = Path("custom_components/ufo_r11_smartir/frontend_panel.py")
-    if not frontend_panel_path.exists():
-        print(f"✗ Frontend panel file not found: {frontend_panel_path}")
-        return False
-    
-    with open(frontend_panel_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Both files are read and parsed once, in the shared analysis
+    entries = component_entries()
+    for path, label in ((FRONTEND_PANEL_PATH, "Frontend panel"), (INIT_PATH, "Init")):
+        if path.name not in entries:
+            print(f"✗ {label} file not found: {path}")
+            return False
     
     try:
-        tree = ast.parse(content)
+        analysis = analyze()
     except SyntaxError as e:
-        print(f"✗ Syntax error in frontend_panel.py: {e}")
+        print(f"✗ Syntax error in {e.filename}: {e}")
         return False
     
-    # Find all function definitions
-    functions = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            functions.append(node.name)
+    # Find all function definitions, sync and async
+    functions = list(analysis.functions)
     
     print(f"Functions found in frontend_panel.py: {functions}")
     
-    # Check for the expected functions
-    has_async_register_panel = "async_register_panel" in functions
-    has_async_setup_frontend_panel = "async_setup_frontend_panel" in functions
+    # Check for the expected functions with one set difference
+    missing = _REQUIRED_FUNCS.difference(functions)
+    has_async_register_panel = "async_register_panel" not in missing
+    has_async_setup_frontend_panel = "async_setup_frontend_panel" not in missing
     
     print(f"✓ Has async_register_panel: {has_async_register_panel}")
     print(f"✓ Has async_setup_frontend_panel: {has_async_setup_frontend_panel}")
     
-    # Read and check __init__.py imports
-    init_path = Path("custom_components/ufo_r11_smartir/__init__.py")
-    if not init_path.exists():
-        print(f"✗ Init file not found: {init_path}")
-        return False
-    
-    with open(init_path, 'r', encoding='utf-8') as f:
-        init_content = f.read()
-    
-    # Check what's being imported
-    imports_async_setup_frontend_panel = "from .frontend_panel import async_setup_frontend_panel" in init_content
-    imports_async_register_panel = "from .frontend_panel import async_register_panel" in init_content
-    calls_async_setup_frontend_panel = "await async_setup_frontend_panel(hass)" in init_content
-    calls_async_register_panel = "await async_register_panel(hass)" in init_content
+    # Check what's being imported in __init__.py
+    imports_async_setup_frontend_panel = analysis.imports_setup
+    imports_async_register_panel = analysis.imports_register
+    calls_async_setup_frontend_panel = analysis.calls_setup
+    calls_async_register_panel = analysis.calls_register
     
     print(f"\nImport analysis in __init__.py:")
     print(f"✓ Imports async_setup_frontend_panel: {imports_async_setup_frontend_panel}")
@@ -78,5 +68,7 @@ def validate_frontend_panel_structure():
         return False
 
 if __name__ == "__main__":
+    # Report output is written in one go at exit instead of flushed per line
+    sys.stdout.reconfigure(line_buffering=False)
     success = validate_frontend_panel_structure()
     sys.exit(0 if success else 1)
\ No newline at end of file
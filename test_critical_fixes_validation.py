@@ -18,18 +18,32 @@ Live log issues addressed:
 import asyncio
 import sys
 import logging
+from operator import itemgetter
 from pathlib import Path
 
+from _validation_cache import count_literals, has_blocking_open, scan_dir, scan_file
+
 # Setup logging to catch any warnings
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def test_manifest_dependency():
+COMPONENT_DIR = Path("custom_components/ufo_r11_smartir")
+REQUIRED_FILES = {
+    name: COMPONENT_DIR / name
+    for name in ("manifest.json", "parser.py", "ir_codes.py", "config_flow.py")
+}
+
+def stat_required_files():
+    """Map each required file name to (exists, path) from one directory listing."""
+    entries = scan_dir(COMPONENT_DIR)
+    return {name: (name in entries, path) for name, path in REQUIRED_FILES.items()}
+
+def test_manifest_dependency(file_map=None):
     """Test that aiofiles dependency was added to manifest.json."""
     logger.info("=== Testing manifest.json aiofiles dependency ===")
     
-    manifest_path = Path("custom_components/ufo_r11_smartir/manifest.json")
-    if not manifest_path.exists():
+    manifest_exists, manifest_path = (file_map or stat_required_files())["manifest.json"]
+    if not manifest_exists:
         logger.error("❌ manifest.json not found")
         return False
         
@@ -42,13 +56,13 @@ def test_manifest_dependency():
     
     if aiofiles_found:
         logger.info("✅ aiofiles dependency found in manifest.json")
-        logger.info(f"   Requirements: {requirements}")
+        logger.info("   Requirements: %s", requirements)
         return True
     else:
         logger.error("❌ aiofiles dependency missing from manifest.json")
         return False
 
-def test_aiofiles_import():
+def test_aiofiles_import(file_map=None):
     """Test that aiofiles can be imported (simulates HA environment)."""
     logger.info("=== Testing aiofiles import availability ===")
     
@@ -57,108 +71,122 @@ def test_aiofiles_import():
         logger.info("✅ aiofiles import successful")
         return True
     except ImportError as e:
-        logger.warning(f"⚠️  aiofiles not installed locally: {e}")
+        logger.warning("⚠️  aiofiles not installed locally: %s", e)
         logger.info("   This is OK - Home Assistant will install it from manifest.json")
         return True
 
-async def test_parser_async_operations():
+def test_parser_async_operations(file_map=None):
     """Test that parser.py uses async file operations."""
     logger.info("=== Testing parser.py async file operations ===")
     
-    parser_path = Path("custom_components/ufo_r11_smartir/parser.py")
-    if not parser_path.exists():
+    parser_exists, parser_path = (file_map or stat_required_files())["parser.py"]
+    if not parser_exists:
         logger.error("❌ parser.py not found")
         return False
     
-    with open(parser_path, 'r') as f:
-        content = f.read()
+    content = parser_path.read_text()
+    
+    counts = count_literals(content, (
+        "async def parse_file(",
+        "import aiofiles",
+        "async with aiofiles.open(",
+    ))
     
     # Check for async function signature
-    if "async def parse_file(" in content:
+    if counts["async def parse_file("]:
         logger.info("✅ parse_file() converted to async function")
     else:
         logger.error("❌ parse_file() not converted to async")
         return False
     
     # Check for aiofiles import
-    if "import aiofiles" in content:
+    if counts["import aiofiles"]:
         logger.info("✅ aiofiles import found in parser.py")
     else:
         logger.error("❌ aiofiles import missing from parser.py")
         return False
     
     # Check for async file operations
-    if "async with aiofiles.open(" in content:
+    if counts["async with aiofiles.open("]:
         logger.info("✅ Non-blocking async file operations found")
     else:
         logger.error("❌ Still using blocking file operations")
         return False
     
     # Check that blocking operations are removed
-    if "with open(" in content and "async with" not in content.split("with open(")[0].split('\n')[-1]:
+    if has_blocking_open(content):
         logger.warning("⚠️  Potential blocking file operations still present")
     else:
         logger.info("✅ No blocking file operations detected")
     
     return True
 
-async def test_ir_codes_async_operations():
+def test_ir_codes_async_operations(file_map=None):
     """Test that ir_codes.py uses async file operations."""
     logger.info("=== Testing ir_codes.py async file operations ===")
     
-    ir_codes_path = Path("custom_components/ufo_r11_smartir/ir_codes.py")
-    if not ir_codes_path.exists():
+    ir_codes_exists, ir_codes_path = (file_map or stat_required_files())["ir_codes.py"]
+    if not ir_codes_exists:
         logger.error("❌ ir_codes.py not found")
         return False
     
-    with open(ir_codes_path, 'r') as f:
-        content = f.read()
+    content = ir_codes_path.read_text()
+    
+    # Presence and the open() count come from the same pass
+    counts = count_literals(content, (
+        "import aiofiles",
+        "async with aiofiles.open(",
+        "await f.read()",
+        "async_add_executor_job(_write_json_file",
+    ))
     
     # Check for aiofiles import
-    if "import aiofiles" in content:
+    if counts["import aiofiles"]:
         logger.info("✅ aiofiles import found in ir_codes.py")
     else:
         logger.error("❌ aiofiles import missing from ir_codes.py")
         return False
     
     # Check for async file operations
-    async_operations = content.count("async with aiofiles.open(")
-    if async_operations >= 2:
-        logger.info(f"✅ Found {async_operations} async file operations (read & write)")
+    async_operations = counts["async with aiofiles.open("]
+    if async_operations and counts["await f.read()"]:
+        logger.info("✅ Found %d async file read operations", async_operations)
     else:
-        logger.error(f"❌ Only found {async_operations} async file operations, expected 2")
+        logger.error("❌ Missing async file read operations")
         return False
     
-    # Check for modern async patterns
-    if "await f.read()" in content and "await f.write(" in content:
-        logger.info("✅ Modern async file read/write patterns found")
+    # Saves serialize, write and rename in a single executor job
+    if counts["async_add_executor_job(_write_json_file"]:
+        logger.info("✅ Non-blocking executor file write found")
     else:
-        logger.error("❌ Missing modern async file read/write patterns")
+        logger.error("❌ Missing non-blocking file write")
         return False
     
     return True
 
-def test_config_flow_modern_pattern():
+def test_config_flow_modern_pattern(file_map=None):
     """Test that config_flow.py uses modern Home Assistant patterns."""
     logger.info("=== Testing config_flow.py modern HA patterns ===")
     
-    config_flow_path = Path("custom_components/ufo_r11_smartir/config_flow.py")
-    if not config_flow_path.exists():
+    config_flow_exists, config_flow_path = (file_map or stat_required_files())["config_flow.py"]
+    if not config_flow_exists:
         logger.error("❌ config_flow.py not found")
         return False
     
-    with open(config_flow_path, 'r') as f:
-        content = f.read()
+    offsets = scan_file(config_flow_path, (
+        b"super().__init__()",
+        b"self.config_entry = config_entry",
+    ))
     
     # Check for modern super() initialization
-    if "super().__init__()" in content:
+    if offsets[b"super().__init__()"] >= 0:
         logger.info("✅ Modern super().__init__() pattern found")
     else:
         logger.error("❌ Modern super().__init__() pattern missing")
         return False
     
     # Check that deprecated pattern is removed
-    if "self.config_entry = config_entry" in content:
+    if offsets[b"self.config_entry = config_entry"] >= 0:
         logger.error("❌ Deprecated self.config_entry assignment still present")
         return False
     else:
@@ -166,6 +194,15 @@ def test_config_flow_modern_pattern():
     
     return True
 
+def _run_test(test_name, test_func, file_map):
+    """Run one validation test, treating an exception as a failure."""
+    logger.info("\n📋 Running: %s", test_name)
+    try:
+        return test_func(file_map)
+    except Exception as e:
+        logger.error("❌ %s failed with error: %s", test_name, e)
+        return False
+
 async def main():
     """Run all validation tests."""
     logger.info("🔍 Starting validation of critical Home Assistant integration fixes...")
@@ -179,35 +216,32 @@ async def main():
         ("Config Flow Modern Pattern", test_config_flow_modern_pattern),
     ]
     
-    results = []
-    for test_name, test_func in tests:
-        logger.info(f"\n📋 Running: {test_name}")
-        try:
-            if asyncio.iscoroutinefunction(test_func):
-                result = await test_func()
-            else:
-                result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            logger.error(f"❌ {test_name} failed with error: {e}")
-            results.append((test_name, False))
+    # Stat every required file once; the tests only consult this map
+    file_map = stat_required_files()
+    
+    # Run the tests one after another so each report section stays together
+    outcomes = [_run_test(test_name, test_func, file_map) for test_name, test_func in tests]
+    # Names and outcomes are kept as parallel lists
+    names = list(map(itemgetter(0), tests))
+    passed = list(map(bool, outcomes))
     
     # Summary
     logger.info("\n" + "=" * 70)
     logger.info("🎯 VALIDATION SUMMARY")
     logger.info("=" * 70)
     
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
+    passed_count = sum(passed)
+    total = len(passed)
     
-    for test_name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
-        logger.info(f"{status}: {test_name}")
+    # The per-test report is only built when INFO records are emitted
+    if logger.isEnabledFor(logging.INFO):
+        for test_name, result in zip(names, passed):
+            logger.info("%s: %s", "✅ PASS" if result else "❌ FAIL", test_name)
     
     logger.info("=" * 70)
-    logger.info(f"📊 Results: {passed}/{total} tests passed")
+    logger.info("📊 Results: %d/%d tests passed", passed_count, total)
     
-    if passed == total:
+    if passed_count == total:
         logger.info("🎉 ALL CRITICAL FIXES VALIDATED SUCCESSFULLY!")
         logger.info("   - Event loop blocking eliminated")
         logger.info("   - Deprecated patterns modernized")
@@ -4,14 +4,36 @@ Test script to diagnose critical Home Assistant integration issues.
 This will help confirm the problems before implementing fixes.
 """
 
+import io
 import sys
-import asyncio
-import logging
-from pathlib import Path
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-# Setup logging
-logging.basicConfig(level=logging.DEBUG, format='%(levelname)s: %(message)s')
-logger = logging.getLogger(__name__)
+# Per-thread output buffer, so concurrent tests do not interleave their prints
+_thread_output = threading.local()
+
+class _ThreadRoutedStdout:
+    """Send writes to the current thread's buffer, or to the real stream."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        buffer = getattr(_thread_output, "buffer", None)
+        return (buffer if buffer is not None else self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+def _run_captured(test_func):
+    """Run one diagnostic test and return everything it printed."""
+    _thread_output.buffer = io.StringIO()
+    try:
+        test_func()
+        return _thread_output.buffer.getvalue()
+    finally:
+        _thread_output.buffer = None
 
 def test_homeassistant_api_issues():
     """Test 1: Check for deprecated Home Assistant API usage."""
@@ -53,28 +75,31 @@ def test_synchronous_io_blocking():
     """Test 2: Demonstrate synchronous I/O blocking issues."""
     print("\n=== TEST 2: Synchronous I/O Blocking Issues ===")
     
-    # Create test file
-    test_file = Path("test_blocking_io.txt")
-    test_file.write_text("Test data for blocking I/O demonstration")
-    
-    print("Testing synchronous (blocking) file operations...")
-    
-    # This simulates the problematic code
-    try:
-        print("🔄 Starting blocking file read...")
-        with open(test_file, 'r', encoding='utf-8') as f:
-            data = f.read()
-        print("✅ Synchronous read completed")
-        print("❌ ISSUE: This blocks the event loop!")
+    # One temporary file, kept open for the read and the rewrite and removed on close
+    with tempfile.NamedTemporaryFile('w+', encoding='utf-8', suffix='.txt') as test_file:
+        test_file.write("Test data for blocking I/O demonstration")
+        test_file.flush()
         
-        print("🔄 Starting blocking file write...")
-        with open(test_file, 'w', encoding='utf-8') as f:
-            f.write("Modified data")
-        print("✅ Synchronous write completed")
-        print("❌ ISSUE: This blocks the event loop!")
+        print("Testing synchronous (blocking) file operations...")
         
-    except Exception as e:
-        print(f"❌ File operation error: {e}")
+        # This simulates the problematic code
+        try:
+            print("🔄 Starting blocking file read...")
+            test_file.seek(0)
+            data = test_file.read()
+            print("✅ Synchronous read completed")
+            print("❌ ISSUE: This blocks the event loop!")
+            
+            print("🔄 Starting blocking file write...")
+            test_file.seek(0)
+            test_file.truncate()
+            test_file.write("Modified data")
+            test_file.flush()
+            print("✅ Synchronous write completed")
+            print("❌ ISSUE: This blocks the event loop!")
+            
+        except Exception as e:
+            print(f"❌ File operation error: {e}")
     
     # Show async solution
     async def async_file_operations():
@@ -87,14 +112,12 @@ def test_synchronous_io_blocking():
         except Exception as e:
             print(f"Note: {e}")
     
-    # Run async demo
+    # Run async demo; asyncio is only needed here
+    import asyncio
     try:
         asyncio.run(async_file_operations())
     except Exception as e:
         print(f"Async demo note: {e}")
-    
-    # Cleanup
-    test_file.unlink(missing_ok=True)
 
 def test_config_flow_issues():
     """Test 3: Check deprecated config flow patterns."""
@@ -136,9 +159,20 @@ def main():
     print("🔍 DIAGNOSING CRITICAL HOME ASSISTANT INTEGRATION ISSUES")
     print("=" * 60)
     
-    test_homeassistant_api_issues()
-    test_synchronous_io_blocking()
-    test_config_flow_issues()
+    tests = [test_homeassistant_api_issues, test_synchronous_io_blocking, test_config_flow_issues]
+    
+    # The tests are independent, so they run concurrently; each one's output
+    # is buffered and printed in the original order once all have finished
+    real_stdout = sys.stdout
+    sys.stdout = _ThreadRoutedStdout(real_stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            outputs = list(executor.map(_run_captured, tests))
+    finally:
+        sys.stdout = real_stdout
+    
+    for output in outputs:
+        sys.stdout.write(output)
     
     print("\n" + "=" * 60)
     print("📋 DIAGNOSIS SUMMARY:")
@@ -148,4 +182,6 @@ def main():
     print("\n🔧 All issues confirmed - ready to implement fixes!")
 
 if __name__ == "__main__":
+    # Report output is written in one go at exit instead of flushed per line
+    sys.stdout.reconfigure(line_buffering=False)
     main()
\ No newline at end of file
@@ -1,25 +1,22 @@
 #!/usr/bin/env python3
 """Final validation script to confirm the frontend panel import fix."""
 
-import ast
 import sys
-from pathlib import Path
+
+from frontend_validation_core import analyze
 
 def validate_import_fix():
     """Validate that the frontend panel import issue is resolved."""
     
     print("=== Final Frontend Panel Import Fix Validation ===\n")
     
-    # Step 1: Verify frontend_panel.py has the required function
-    frontend_panel_path = Path("custom_components/ufo_r11_smartir/frontend_panel.py")
-    
-    with open(frontend_panel_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Both files are read and parsed once, in the shared analysis
+    analysis = analyze()
     
-    # Check for the required function definition
-    has_async_setup_frontend_panel = "async def async_setup_frontend_panel(hass: HomeAssistant)" in content
-    has_async_register_panel = "async def async_register_panel(hass: HomeAssistant)" in content
-    has_async_unregister_panel = "async def async_unregister_panel(hass: HomeAssistant)" in content
+    # Step 1: Verify frontend_panel.py has the required function
+    has_async_setup_frontend_panel = analysis.has_async_setup_frontend_panel
+    has_async_register_panel = analysis.has_async_register_panel
+    has_async_unregister_panel = analysis.has_async_unregister_panel
     
     print("1. Frontend Panel Function Check:")
     print(f"   ✓ async_setup_frontend_panel: {has_async_setup_frontend_panel}")
@@ -31,16 +28,10 @@ def validate_import_fix():
         return False
     
     # Step 2: Verify __init__.py imports are correct
-    init_path = Path("custom_components/ufo_r11_smartir/__init__.py")
-    
-    with open(init_path, 'r', encoding='utf-8') as f:
-        init_content = f.read()
-    
-    # Check imports
-    imports_setup = "from .frontend_panel import async_setup_frontend_panel" in init_content
-    imports_unregister = "async_unregister_panel" in init_content
-    calls_setup = "await async_setup_frontend_panel(hass)" in init_content
-    calls_unregister = "await async_unregister_panel(hass)" in init_content
+    imports_setup = analysis.imports_setup
+    imports_unregister = analysis.imports_unregister
+    calls_setup = analysis.calls_setup
+    calls_unregister = analysis.calls_unregister
     
     print("\n2. Import and Usage Check:")
     print(f"   ✓ Imports async_setup_frontend_panel: {imports_setup}")
@@ -53,7 +44,7 @@ def validate_import_fix():
         return False
     
     # Step 3: Check wrapper function implementation
-    setup_calls_register = "await async_register_panel(hass)" in content
+    setup_calls_register = analysis.setup_calls_register
     
     print("\n3. Wrapper Function Implementation:")
     print(f"   ✓ async_setup_frontend_panel calls async_register_panel: {setup_calls_register}")
@@ -63,7 +54,7 @@ def validate_import_fix():
         return False
     
     # Step 4: Check for proper error handling
-    has_error_handling = "try:" in content and "except Exception as e:" in content
+    has_error_handling = analysis.has_error_handling
     
     print("\n4. Error Handling Check:")
     print(f"   ✓ Has proper error handling: {has_error_handling}")
@@ -6,9 +6,12 @@ This will help validate the proper method for registering static paths.
 
 import asyncio
 import logging
+from operator import attrgetter
 from unittest.mock import MagicMock, AsyncMock
 from pathlib import Path
 
+_get_url_path = attrgetter("url_path")
+
 # Mock Home Assistant components
 class MockHTTP:
     """Mock HTTP component to test API calls"""
@@ -26,12 +29,13 @@ class MockHTTP:
         """Mock the plural async_register_static_paths method"""
         print(f"✗ async_register_static_paths called with: {paths_list}")
         # This should fail with AttributeError when accessing url_path
-        for path_config in paths_list:
-            if hasattr(path_config, 'url_path'):
-                print(f"  - Object has url_path: {path_config.url_path}")
-            else:
-                print(f"  - ERROR: Object missing url_path attribute: {type(path_config)} - {path_config}")
-                raise AttributeError("'dict' object has no attribute 'url_path'")
+        try:
+            url_paths = list(map(_get_url_path, paths_list))
+        except AttributeError as e:
+            print(f"  - ERROR: Object missing url_path attribute: {e}")
+            raise
+        for url_path in url_paths:
+            print(f"  - Object has url_path: {url_path}")
 
 class MockHass:
     """Mock Home Assistant instance"""
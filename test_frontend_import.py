@@ -4,8 +4,9 @@
 import sys
 from pathlib import Path
 
-# Add the custom_components directory to the path
-sys.path.insert(0, str(Path(__file__).parent / "custom_components"))
+# Script runs need the integration on the path; under pytest conftest.py adds it
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent / "custom_components"))
 
 def test_import_fix():
     """Test different import scenarios to validate the fix."""
@@ -7,7 +7,27 @@ import json
 import re
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, Iterator, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Base64 alphabet with at most two padding characters at the end
+_B64_RE = re.compile(rb'[A-Za-z0-9+/]*={0,2}')
+
+# Category of each fixed command name; "auto" is a mode, not a fan speed
+_COMMAND_CATEGORIES = {
+    "ON": "power", "OFF": "power",
+    "cool": "modes", "heat": "modes", "dry": "modes", "fan": "modes", "auto": "modes", "sleep": "modes",
+    "low": "fan", "medium": "fan", "high": "fan",
+}
+
+
+def _is_tempkey(name: str) -> bool:
+    """Return True for temperature command names such as "20c"."""
+    return len(name) == 3 and name[2] == 'c' and name[0].isdecimal() and name[1].isdecimal()
 
 
 class IRCommand:
@@ -16,8 +36,16 @@ class IRCommand:
     def __init__(self, name: str, ir_code: str):
         self.name = name
         self.ir_code = ir_code
+        self._decoded = None
         self.validate()
     
+    @property
+    def decoded(self) -> bytes:
+        """IR code bytes, decoded on first access."""
+        if self._decoded is None:
+            self._decoded = base64.b64decode(self.ir_code, validate=True)
+        return self._decoded
+    
     def validate(self) -> None:
         """Validate the IR command."""
         if not self.name or not self.name.strip():
@@ -26,44 +54,29 @@ class IRCommand:
         if not self.ir_code or not self.ir_code.strip():
             raise ValueError("IR code cannot be empty")
         
-        # Validate Base64 encoding
+        # Validate Base64 encoding by its alphabet and length; no bytes are decoded
         try:
-            base64.b64decode(self.ir_code)
-        except Exception as err:
+            raw = self.ir_code.encode('ascii')
+        except UnicodeEncodeError as err:
             raise ValueError(f"Invalid Base64 IR code: {err}")
+        if len(raw) % 4 or not _B64_RE.fullmatch(raw):
+            raise ValueError("Invalid Base64 IR code: bad alphabet, padding or length")
 
 
 class PointCodesParser:
     """Parser for Point-codes file format."""
     
-    def __init__(self):
-        self.command_pattern = re.compile(r'^([^-]+)\s*-\s*(.+)$')
-    
     async def parse_file(self, file_path: str) -> Dict[str, IRCommand]:
         """Parse Point-codes file and return IR commands."""
-        commands = {}
-        
+        # The file read is blocking, so it runs in a worker thread
+        return await asyncio.to_thread(self._parse_sync, file_path)
+    
+    def _parse_sync(self, file_path: str) -> Dict[str, IRCommand]:
+        """Read and parse a Point-codes file; blocking, call from a worker thread."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                for line_num, line in enumerate(file, 1):
-                    line = line.strip()
-                    if not line:  # Skip empty lines
-                        continue
-                    
-                    match = self.command_pattern.match(line)
-                    if not match:
-                        print(f"Warning: Line {line_num} doesn't match expected format: {line}")
-                        continue
-                    
-                    command_name = match.group(1).strip()
-                    ir_code = match.group(2).strip()
-                    
-                    try:
-                        command = IRCommand(command_name, ir_code)
-                        commands[command_name] = command
-                    except ValueError as err:
-                        print(f"Warning: Invalid command on line {line_num}: {err}")
-                        continue
+            # One bulk read; the split into lines happens in C
+            lines = Path(file_path).read_text(encoding='utf-8').splitlines()
+            commands = {name: command for name, command in self._iter_commands(lines)}
         
         except FileNotFoundError:
             raise FileNotFoundError(f"Point-codes file not found: {file_path}")
@@ -71,24 +84,46 @@ class PointCodesParser:
             raise RuntimeError(f"Failed to parse Point-codes file: {err}")
         
         return commands
+    
+    def _iter_commands(self, lines: List[str]) -> Iterator[Tuple[str, IRCommand]]:
+        """Yield (name, command) for each valid line, warning about the rest."""
+        for line_num, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line:  # Skip empty lines
+                continue
+            
+            # Lines are "name - code"; the name runs up to the first '-'
+            idx = line.find('-')
+            ir_code = line[idx + 1:].lstrip() if idx > 0 else ""
+            if not ir_code:
+                print(f"Warning: Line {line_num} doesn't match expected format: {line}")
+                continue
+            
+            command_name = line[:idx].rstrip()
+            
+            try:
+                command = IRCommand(command_name, ir_code)
+            except ValueError as err:
+                print(f"Warning: Invalid command on line {line_num}: {err}")
+                continue
+            
+            yield command_name, command
 
 
 class SmartIRGenerator:
     """Generate SmartIR configuration from IR commands."""
     
-    def __init__(self):
-        self.temperature_pattern = re.compile(r'^(\d{2})c$')
-    
     async def generate_config(self, device_id: str, device_name: str, ir_commands: Dict[str, IRCommand]) -> Dict[str, Any]:
         """Generate SmartIR JSON configuration."""
         
         # Extract temperature commands
         temp_commands = {}
         for name, cmd in ir_commands.items():
-            match = self.temperature_pattern.match(name)
-            if match:
-                temp = int(match.group(1))
-                temp_commands[temp] = cmd.ir_code
+            if _is_tempkey(name):
+                temp_commands[int(name[:2])] = cmd.ir_code
+        
+        # Mode operations do not depend on the mode, so all modes share one list
+        temp_ops = [{"temperature": temp, "ir_code": ir_code} for temp, ir_code in sorted(temp_commands.items())]
         
         # Build SmartIR configuration
         config = {
@@ -102,28 +137,15 @@ class SmartIRGenerator:
             },
             "operations": {
                 "off": [{"ir_code": ir_commands["OFF"].ir_code}] if "OFF" in ir_commands else [],
-                "cool": self._build_mode_operations("cool", temp_commands, ir_commands),
-                "heat": self._build_mode_operations("heat", temp_commands, ir_commands),
-                "dry": self._build_mode_operations("dry", temp_commands, ir_commands),
-                "fan_only": self._build_mode_operations("fan", temp_commands, ir_commands),
-                "auto": self._build_mode_operations("auto", temp_commands, ir_commands),
+                "cool": temp_ops,
+                "heat": temp_ops,
+                "dry": temp_ops,
+                "fan_only": temp_ops,
+                "auto": temp_ops,
             }
         }
         
         return config
-    
-    def _build_mode_operations(self, mode: str, temp_commands: Dict[int, str], ir_commands: Dict[str, IRCommand]) -> list:
-        """Build operations for a specific mode."""
-        operations = []
-        
-        for temp, ir_code in sorted(temp_commands.items()):
-            operation = {
-                "temperature": temp,
-                "ir_code": ir_code
-            }
-            operations.append(operation)
-        
-        return operations
 
 
 async def test_ir_core():
@@ -155,13 +177,19 @@ async def test_ir_core():
     # Test 2: Validate IR codes
     print("\n2. Testing IR Code Validation...")
     try:
+        # Parsing only checked the Base64 alphabet; re-check it and decode for real
         valid_count = 0
         for name, cmd in ir_commands.items():
             try:
-                base64.b64decode(cmd.ir_code)
+                cmd.validate()
+                decoded = cmd.decoded
+            except ValueError as err:
+                print(f"   ⚠️ Invalid Base64 in command: {name} ({err})")
+                continue
+            if decoded:
                 valid_count += 1
-            except Exception:
-                print(f"   ⚠️ Invalid Base64 in command: {name}")
+            else:
+                print(f"   ⚠️ Empty IR code in command: {name}")
         
         print(f"✅ {valid_count}/{len(ir_commands)} commands have valid Base64 encoding")
         
@@ -180,17 +208,11 @@ async def test_ir_core():
             "swing": []
         }
         
-        temp_pattern = re.compile(r'^(\d{2})c$')
-        
-        for name in ir_commands.keys():
-            if temp_pattern.match(name):
+        for name in ir_commands:
+            if _is_tempkey(name):
                 categories["temperature"].append(name)
-            elif name in ["ON", "OFF"]:
-                categories["power"].append(name)
-            elif name in ["cool", "heat", "dry", "fan", "auto", "sleep"]:
-                categories["modes"].append(name)
-            elif name in ["low", "medium", "high", "auto"]:
-                categories["fan"].append(name)
+            elif (category := _COMMAND_CATEGORIES.get(name)):
+                categories[category].append(name)
             elif "swing" in name.lower():
                 categories["swing"].append(name)
         
@@ -236,9 +258,14 @@ async def test_ir_core():
     # Test 5: Export test config
     print("\n5. Testing Configuration Export...")
     try:
+        # Only the write is under test, so the file is compact, not indented
         output_file = "test_smartir_config.json"
-        with open(output_file, 'w') as f:
-            json.dump(smartir_config, f, indent=2)
+        if orjson is not None:
+            content = orjson.dumps(smartir_config)
+        else:
+            content = json.dumps(smartir_config, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        with open(output_file, 'wb') as f:
+            f.write(content)
         
         print(f"✅ SmartIR configuration exported to {output_file}")
         
@@ -7,9 +7,9 @@ import sys
 import os
 from pathlib import Path
 
-# Add the custom components path to sys.path
-custom_components_path = str(Path(__file__).parent / "custom_components")
-sys.path.insert(0, custom_components_path)
+# Script runs need the integration on the path; under pytest conftest.py adds it
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent / "custom_components"))
 
 # Now import as a package
 from ufo_r11_smartir.parser import PointCodesParser
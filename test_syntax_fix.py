@@ -5,6 +5,8 @@ import ast
 import sys
 from pathlib import Path
 
+from _validation_cache import read_source
+
 def test_syntax_validation():
     """Test that the fixed __init__.py file has valid Python syntax."""
     try:
@@ -14,12 +16,10 @@ def test_syntax_validation():
             print("❌ ERROR: __init__.py file not found!")
             return False
             
-        with open(init_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_source(init_file)
         
-        # Parse the Python code to check for syntax errors
-        ast.parse(content)
-        print("✅ SUCCESS: __init__.py has valid Python syntax!")
+        # The substring checks are cheap, so they run first; the file is
+        # only parsed once they have all passed
         
         # Check if the old method call is gone
         if "setup_device_from_pointcodes" in content:
@@ -41,6 +41,10 @@ def test_syntax_validation():
         else:
             print("❌ ERROR: Required constants not found in method call!")
             return False
+        
+        # Parse the Python code to check for syntax errors
+        ast.parse(content)
+        print("✅ SUCCESS: __init__.py has valid Python syntax!")
             
         return True
         
@@ -60,8 +64,7 @@ def check_device_manager_methods():
             print("❌ ERROR: device_manager.py file not found!")
             return False
             
-        with open(dm_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_source(dm_file)
         
         print("\n=== DeviceManager Method Analysis ===")
         